@@ -1,20 +1,57 @@
+import asyncio
 import csv
 import json
 import os
+import re
 import datetime as dt
+import functools
+import hashlib
+import html
+import io
+import itertools
 import time
 import threading
-from collections import deque
+from array import array
+from collections import defaultdict
+from concurrent.futures import Future
+from contextlib import asynccontextmanager
 from pathlib import Path
 import zipfile
-import xml.etree.ElementTree as ET
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+try:
+    from lxml import etree as xml_etree
+
+    HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as xml_etree
+
+    HAS_LXML = False
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+    json_loads = orjson.loads
+
+    def json_dumps(value) -> str:
+        try:
+            return orjson.dumps(value).decode()
+        except TypeError:
+            return json.dumps(value, ensure_ascii=False)
+
+except ImportError:
+    HAS_ORJSON = False
+    json_loads = json.loads
+
+    def json_dumps(value) -> str:
+        return json.dumps(value, ensure_ascii=False)
 
 from fastapi import Depends, FastAPI, HTTPException, Request, status
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_serializer, field_validator
 from sqlalchemy import (
     Boolean,
     Column,
@@ -22,14 +59,23 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
+    TypeDecorator,
+    cast,
     create_engine,
+    event,
     func,
+    insert,
+    or_,
     select,
     text,
+    type_coerce,
+    update,
 )
-from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, aliased, declarative_base, load_only, raiseload, relationship, sessionmaker
 
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data.db")
@@ -38,11 +84,21 @@ STATIC_DIR = Path(__file__).resolve().parent / "static"
 EXCEL_EPOCH = dt.date(1899, 12, 30)
 IMAGE_DIR = FILES_DIR / "image"
 SW_PATH = STATIC_DIR / "service-worker.js"
+INDEX_PATH = STATIC_DIR / "index.html"
+XLSX_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
 LOCAL_TZ = dt.timezone(dt.timedelta(hours=9))  # KST
 ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "").strip()
 RATE_LIMIT_WINDOW = int(os.getenv("RATE_LIMIT_WINDOW", "10"))
 RATE_LIMIT_MAX = int(os.getenv("RATE_LIMIT_MAX", "120"))
 RATE_LIMIT_MUTATION_MAX = int(os.getenv("RATE_LIMIT_MUTATION_MAX", "40"))
+RATE_LIMIT_SWEEP_EVERY = 1024
+MUTATION_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+TIMESERIES_CACHE_TTL = float(os.getenv("TIMESERIES_CACHE_TTL", "5"))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+SCHEMA_VERSION = 6  # 테이블/컬럼/인덱스를 추가하면 올린다
+SEED_VERSION = 1  # seed 규칙이 바뀌면 올려서 재시딩
 EVENT_TYPE_OPTIONS = {"업데이트", "스토리", "픽업", "컨텐츠", "파밍", "시즌", "주년", "페이백"}
 EVENT_PRIORITY_OPTIONS = {"매우낮음", "낮음", "중간", "높음", "매우높음"}
 
@@ -57,64 +113,141 @@ REFRESH_DEFAULTS: Dict[str, Tuple[Optional[int], Optional[str]]] = {
     "스텔라 소라": (2, "05:00"),
 }
 
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",
+    "cache_size=-65536",
+)
+
+def _pool_options(url: str) -> Dict[str, object]:
+    if make_url(url).database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+    }
+
+
 engine = create_engine(
-    DATABASE_URL, echo=False, future=True, connect_args={"check_same_thread": False}
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    connect_args={"check_same_thread": False},
+    **_pool_options(DATABASE_URL),
+)
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_conn, _record) -> None:
+        cursor = dbapi_conn.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(f"PRAGMA {pragma}")
+        cursor.close()
+
+
+SessionLocal = sessionmaker(
+    bind=engine, autoflush=False, autocommit=False, future=True, expire_on_commit=False
 )
-SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
 Base = declarative_base()
 
 
+class UTCDateTime(TypeDecorator):
+    # SQLite는 tz 정보를 버리므로 로드 시점에 한 번 UTC로 붙여 둔다
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_result_value(self, value, dialect):
+        if value is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=dt.timezone.utc)
+
+
 def excel_serial_to_date(value: float) -> dt.date:
     return EXCEL_EPOCH + dt.timedelta(days=int(value))
 
-def today_local() -> dt.date:
+@functools.lru_cache(maxsize=1)
+def _server_date_at(_second: int) -> dt.date:
+    return dt.date.today()
+
+
+def cached_today() -> dt.date:
+    return _server_date_at(int(time.time()))
+
+
+@functools.lru_cache(maxsize=1)
+def _local_date_at(_second: int) -> dt.date:
     return dt.datetime.now(LOCAL_TZ).date()
 
-def _ts(entry_ts: Optional[dt.datetime]) -> dt.datetime:
-    if entry_ts is None:
-        return dt.datetime.min.replace(tzinfo=dt.timezone.utc)
-    if entry_ts.tzinfo is None:
-        return entry_ts.replace(tzinfo=dt.timezone.utc)
-    return entry_ts
+
+def today_local() -> dt.date:
+    return _local_date_at(int(time.time()))
+
+TRUE_TOKENS = frozenset({"true", "1", "y", "yes", "t", "on"})
+CURRENCY_TYPES = frozenset({"MAIN", "GACHA", "NONE"})
+PULL_CURRENCY_TYPES = frozenset({"MAIN", "GACHA"})
+REWARD_MODES = frozenset({"DAILY", "ONCE", "DISABLED"})
+_STRIP_THOUSANDS = str.maketrans("", "", ",")
 
 
 def parse_bool(value: Optional[str], default: bool = False) -> bool:
     if value is None:
         return default
-    return str(value).strip().lower() in {"true", "1", "y", "yes", "t", "on"}
+    if isinstance(value, bool):
+        return value
+    text = value if isinstance(value, str) else str(value)
+    return text.strip().lower() in TRUE_TOKENS
 
 
 def parse_int(value: Optional[str], default: Optional[int] = None) -> Optional[int]:
     if value is None:
         return default
-    text = str(value).strip()
+    if type(value) is int:
+        return value
+    text = (value if isinstance(value, str) else str(value)).strip()
     if not text:
         return default
+    if "," in text:
+        text = text.translate(_STRIP_THOUSANDS)
     try:
-        return int(text.replace(",", ""))
+        return int(text)
     except ValueError:
         return default
 
 def parse_float(value: Optional[str], default: Optional[float] = None) -> Optional[float]:
     if value is None:
         return default
-    text = str(value).strip()
+    if type(value) in (int, float):
+        return float(value)
+    text = (value if isinstance(value, str) else str(value)).strip()
     if not text:
         return default
+    if "," in text:
+        text = text.translate(_STRIP_THOUSANDS)
     try:
-        return float(text.replace(",", ""))
+        return float(text)
     except ValueError:
         return default
 
 
 def normalize_currency_type(value: Optional[str]) -> str:
+    if value in CURRENCY_TYPES:
+        return value
     text = (value or "NONE").strip().strip("`'\"")
     up = text.upper()
-    if up in {"MAIN", "GACHA", "NONE"}:
+    if up in CURRENCY_TYPES:
         return up
     return "NONE"
 
 
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%Y년 %m월 %d일")
+_NUMERIC_DATE = re.compile(r"(\d{4})([-/.])(\d{1,2})\2(\d{1,2})")
+_EXCEL_SERIAL = re.compile(r"\d+(?:\.0*)?")
+
+
 def parse_date_value(value: Optional[str]) -> Optional[dt.date]:
     if value is None:
         return None
@@ -123,18 +256,22 @@ def parse_date_value(value: Optional[str]) -> Optional[dt.date]:
     text = str(value).strip()
     if not text:
         return None
-    try:
-        numeric = float(text)
-        if numeric.is_integer() and numeric >= 30000:
-            return excel_serial_to_date(numeric)
-    except ValueError:
-        pass
-    for fmt in ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d"):
+    return _parse_date_text(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_text(text: str) -> Optional[dt.date]:
+    match = _NUMERIC_DATE.fullmatch(text)
+    if match:
+        year, _, month, day = match.groups()
         try:
-            return dt.datetime.strptime(text, fmt).date()
+            return dt.date(int(year), int(month), int(day))
         except ValueError:
-            continue
-    for fmt in ("%Y년 %m월 %d일",):
+            return None
+    if _EXCEL_SERIAL.fullmatch(text):
+        numeric = float(text)
+        return excel_serial_to_date(numeric) if numeric >= 30000 else None
+    for fmt in DATE_FORMATS:
         try:
             return dt.datetime.strptime(text, fmt).date()
         except ValueError:
@@ -150,6 +287,11 @@ def parse_time_value(value: Optional[str]) -> Optional[dt.time]:
     text = str(value).strip()
     if not text:
         return None
+    return _parse_time_text(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_time_text(text: str) -> Optional[dt.time]:
     try:
         return dt.datetime.strptime(text, "%H:%M").time()
     except ValueError:
@@ -165,165 +307,200 @@ def parse_refresh_day(value: Optional[str]) -> Optional[int]:
     return None
 
 
-WEEKDAY_LABELS = {
-    1: "일요일",
-    2: "월요일",
-    3: "화요일",
-    4: "수요일",
-    5: "목요일",
-    6: "금요일",
-    7: "토요일",
-}
+WEEKDAY_LABELS = (None, "일요일", "월요일", "화요일", "수요일", "목요일", "금요일", "토요일")
 
 
 def weekday_label(day: Optional[int]) -> Optional[str]:
-    if day is None:
+    if day is None or not 1 <= day <= 7:
         return None
-    return WEEKDAY_LABELS.get(day)
+    return WEEKDAY_LABELS[day]
+
+
+_COLUMN_LETTER_VALUES = bytes(
+    (code - 64) if 65 <= code <= 90 else (code - 96) if 97 <= code <= 122 else 0
+    for code in range(256)
+)
 
 
 def column_index_from_ref(cell_ref: str) -> int:
-    letters = "".join(ch for ch in cell_ref if ch.isalpha())
     index = 0
-    for ch in letters:
-        index = index * 26 + (ord(ch.upper()) - ord("A") + 1)
+    for code in cell_ref.rstrip("0123456789").encode("ascii", "ignore"):
+        index = index * 26 + _COLUMN_LETTER_VALUES[code]
     return index
 
 
-def load_xlsx_rows(path: Path) -> List[List[str]]:
+def _iterparse_elements(source, tag: str) -> Iterator:
+    if HAS_LXML:
+        for _, elem in xml_etree.iterparse(source, events=("end",), tag=tag):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+    for _, elem in xml_etree.iterparse(source, events=("end",)):
+        if elem.tag == tag:
+            yield elem
+            elem.clear()
+
+
+_SHARED_STRING_TEXT = re.compile(rb"<t(?:\s[^>]*)?>([^<]*)</t>")
+_SHARED_STRING_COMPLEX = (b"<r>", b"<rPh", b"<![CDATA[", b"\r", b"<t/>")
+
+
+def _read_shared_strings(data: bytes) -> List[str]:
+    texts = _SHARED_STRING_TEXT.findall(data)
+    if len(texts) == data.count(b"<si>") and not any(tok in data for tok in _SHARED_STRING_COMPLEX):
+        return [
+            html.unescape(text.decode("utf-8")) if b"&" in text else text.decode("utf-8")
+            for text in texts
+        ]
+    return [
+        "".join(t.text or "" for t in si.iter(f"{XLSX_NS}t"))
+        for si in _iterparse_elements(io.BytesIO(data), f"{XLSX_NS}si")
+    ]
+
+
+def iter_xlsx_rows(path: Path) -> Iterator[List[str]]:
     if not path.exists():
-        return []
+        return
     with zipfile.ZipFile(path) as z:
         shared_strings: List[str] = []
         if "xl/sharedStrings.xml" in z.namelist():
-            root = ET.fromstring(z.read("xl/sharedStrings.xml"))
-            for si in root.findall(
-                ".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}si"
-            ):
-                texts = [
-                    t.text or ""
-                    for t in si.findall(
-                        ".//{http://schemas.openxmlformats.org/spreadsheetml/2006/main}t"
-                    )
-                ]
-                shared_strings.append("".join(texts))
+            shared_strings = _read_shared_strings(z.read("xl/sharedStrings.xml"))
 
-        rows: List[List[str]] = []
-        ns = {"a": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        cell_tag, value_tag, text_tag = f"{XLSX_NS}c", f"{XLSX_NS}v", f"{XLSX_NS}t"
         with z.open("xl/worksheets/sheet1.xml") as f:
-            root = ET.parse(f).getroot()
-            for row in root.findall(".//a:sheetData/a:row", ns):
-                cells: Dict[int, str] = {}
-                max_idx = 0
-                for cell in row.findall("a:c", ns):
-                    ref = cell.attrib.get("r", "")
-                    col_idx = column_index_from_ref(ref)
-                    t_attr = cell.attrib.get("t")
-                    raw = ""
-                    if t_attr == "s":
-                        v_elem = cell.find("a:v", ns)
-                        raw = shared_strings[int(v_elem.text)] if v_elem is not None else ""
-                    elif t_attr == "inlineStr":
-                        t_elem = cell.find(".//a:t", ns)
+            for row in _iterparse_elements(f, f"{XLSX_NS}row"):
+                values: List[str] = []
+                for cell in row:
+                    if cell.tag != cell_tag:
+                        continue
+                    col_idx = column_index_from_ref(cell.get("r", ""))
+                    t_attr = cell.get("t")
+                    if t_attr == "inlineStr":
+                        t_elem = next(cell.iter(text_tag), None)
                         raw = t_elem.text if t_elem is not None else ""
                     else:
-                        v_elem = cell.find("a:v", ns)
+                        v_elem = cell.find(value_tag)
                         raw = v_elem.text if v_elem is not None else ""
+                        if t_attr == "s":
+                            raw = shared_strings[int(raw)] if v_elem is not None else ""
                     if col_idx:
-                        cells[col_idx] = raw
-                        max_idx = max(max_idx, col_idx)
-                if max_idx == 0:
-                    rows.append([])
-                    continue
-                ordered = [cells.get(i, "") for i in range(1, max_idx + 1)]
-                rows.append(ordered)
-        return rows
+                        if col_idx > len(values):
+                            values.extend([""] * (col_idx - len(values)))
+                        values[col_idx - 1] = raw
+                yield values
+
+
+XlsxRows = Tuple[Tuple[str, ...], ...]
+
+
+def _file_version(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+@functools.lru_cache(maxsize=8)
+def _load_xlsx_rows_at(path: Path, mtime_ns: int) -> XlsxRows:
+    return tuple(tuple(row) for row in iter_xlsx_rows(path))
 
 
-def read_csv_rows(path: Path) -> List[Dict[str, str]]:
+def load_xlsx_rows(path: Path) -> XlsxRows:
+    mtime_ns = _file_version(path)
+    if mtime_ns is None:
+        return ()
+    return _load_xlsx_rows_at(path, mtime_ns)
+
+
+_BLANK_CELLS = itertools.repeat("")
+
+
+def xlsx_records(rows: Iterable[Sequence[str]]) -> Iterator[Dict[str, str]]:
+    rows = iter(rows)
+    headers = next(rows, None)
+    if not headers:
+        return
+    for row in rows:
+        yield dict(zip(headers, itertools.chain(row, _BLANK_CELLS)))
+
+
+def iter_xlsx_records(path: Path) -> Iterator[Dict[str, str]]:
+    return xlsx_records(iter_xlsx_rows(path))
+
+
+def read_csv_rows(path: Path) -> Iterator[Dict[str, str]]:
     if not path.exists():
-        return []
-    with path.open(encoding="utf-8-sig") as f:
-        reader = csv.DictReader(f)
-        rows: List[Dict[str, str]] = []
-        for row in reader:
-            cleaned = {(k or "").strip(): (v or "").strip() for k, v in row.items()}
-            if any(cleaned.values()):
-                rows.append(cleaned)
-    return rows
+        return
+    with path.open(encoding="utf-8-sig", newline="") as f:
+        reader = csv.reader(f)
+        headers = [h.strip() for h in next(reader, [])]
+        width = len(headers)
+        for raw in reader:
+            values = [v.strip() for v in raw]
+            if not any(values):
+                continue
+            if len(values) < width:
+                values.extend([""] * (width - len(values)))
+            yield dict(zip(headers, values))
 
 
-def load_game_gacha_map() -> Dict[str, int]:
-    path = FILES_DIR / "GameDB.xlsx"
-    rows = load_xlsx_rows(path)
-    if not rows:
-        return {}
-    headers = rows[0]
-    gacha_idx = headers.index("Gacha") if "Gacha" in headers else None
-    title_idx = headers.index("Title") if "Title" in headers else None
-    if gacha_idx is None or title_idx is None:
-        return {}
-    mapping: Dict[str, int] = {}
-    for r in rows[1:]:
-        if len(r) <= max(gacha_idx, title_idx):
-            continue
-        title = r[title_idx]
-        gacha_val = parse_int(r[gacha_idx], default=0) or 0
-        if not title:
-            continue
-        mapping[title] = gacha_val
-    return mapping
+GameMetaMaps = Tuple[
+    Dict[str, int], Dict[str, str], Dict[str, Tuple[Optional[int], Optional[dt.time]]]
+]
 
 
-def load_game_memo_map() -> Dict[str, str]:
+def load_game_meta_maps() -> GameMetaMaps:
     path = FILES_DIR / "GameDB.xlsx"
-    rows = load_xlsx_rows(path)
-    if not rows:
-        return {}
-    headers = rows[0]
-    memo_idx = headers.index("Memo") if "Memo" in headers else None
-    title_idx = headers.index("Title") if "Title" in headers else None
-    if memo_idx is None or title_idx is None:
-        return {}
-    mapping: Dict[str, str] = {}
-    for r in rows[1:]:
-        if len(r) <= max(memo_idx, title_idx):
-            continue
-        title = r[title_idx]
-        memo = r[memo_idx]
-        if not title:
-            continue
-        if memo:
-            mapping[title] = memo
-    return mapping
+    return _load_game_meta_maps_at(path, _file_version(path))
 
 
-def load_game_refresh_map() -> Dict[str, Tuple[Optional[int], Optional[dt.time]]]:
-    path = FILES_DIR / "GameDB.xlsx"
-    rows = load_xlsx_rows(path)
+@functools.lru_cache(maxsize=4)
+def _load_game_meta_maps_at(path: Path, mtime_ns: Optional[int]) -> GameMetaMaps:
+    gacha_map: Dict[str, int] = {}
+    memo_map: Dict[str, str] = {}
+    refresh_map: Dict[str, Tuple[Optional[int], Optional[dt.time]]] = {}
+    rows = load_xlsx_rows(path) if mtime_ns is not None else ()
     if not rows:
-        return {}
+        return gacha_map, memo_map, refresh_map
     headers = rows[0]
-    title_idx = headers.index("Title") if "Title" in headers else None
-    day_idx = headers.index("RefreshDay") if "RefreshDay" in headers else None
-    time_idx = headers.index("RefreshTime") if "RefreshTime" in headers else None
-    if title_idx is None or (day_idx is None and time_idx is None):
-        return {}
-    mapping: Dict[str, Tuple[Optional[int], Optional[dt.time]]] = {}
+
+    def col(name: str) -> Optional[int]:
+        return headers.index(name) if name in headers else None
+
+    title_idx = col("Title")
+    if title_idx is None:
+        return gacha_map, memo_map, refresh_map
+    gacha_idx, memo_idx = col("Gacha"), col("Memo")
+    day_idx, time_idx = col("RefreshDay"), col("RefreshTime")
+    has_refresh = day_idx is not None or time_idx is not None
+    refresh_width = max(title_idx, day_idx or 0, time_idx or 0)
     for r in rows[1:]:
-        if len(r) <= max(title_idx, day_idx or 0, time_idx or 0):
+        if len(r) <= title_idx:
             continue
         title = r[title_idx]
         if not title:
             continue
-        day_val = parse_refresh_day(r[day_idx]) if day_idx is not None else None
-        time_val = parse_time_value(r[time_idx]) if time_idx is not None else None
-        mapping[title] = (day_val, time_val)
-    return mapping
+        if gacha_idx is not None and len(r) > gacha_idx:
+            gacha_map[title] = parse_int(r[gacha_idx], default=0) or 0
+        if memo_idx is not None and len(r) > memo_idx and r[memo_idx]:
+            memo_map[title] = r[memo_idx]
+        if has_refresh and len(r) > refresh_width:
+            day_val = parse_refresh_day(r[day_idx]) if day_idx is not None else None
+            time_val = parse_time_value(r[time_idx]) if time_idx is not None else None
+            refresh_map[title] = (day_val, time_val)
+    return gacha_map, memo_map, refresh_map
 
 
 def load_currency_meta_map() -> Dict[Tuple[str, str], Tuple[str, float]]:
-    rows = read_csv_rows(FILES_DIR / "CurrencyDB.csv")
+    path = FILES_DIR / "CurrencyDB.csv"
+    return _load_currency_meta_map_at(path, _file_version(path))
+
+
+@functools.lru_cache(maxsize=4)
+def _load_currency_meta_map_at(path: Path, mtime_ns: Optional[int]) -> Dict[Tuple[str, str], Tuple[str, float]]:
+    rows = read_csv_rows(path) if mtime_ns is not None else ()
     mapping: Dict[Tuple[str, str], Tuple[str, float]] = {}
     for row in rows:
         title = row.get("Title")
@@ -339,7 +516,12 @@ def load_currency_meta_map() -> Dict[Tuple[str, str], Tuple[str, float]]:
 def parse_task_list(raw: Optional[str]) -> List[str]:
     if raw is None:
         return []
-    return [part.strip() for part in str(raw).split(";") if part.strip()]
+    return list(_split_task_list(str(raw)))
+
+
+@functools.lru_cache(maxsize=512)
+def _split_task_list(raw: str) -> Tuple[str, ...]:
+    return tuple(part.strip() for part in raw.split(";") if part.strip())
 
 
 def encode_task_list(values: List[str]) -> str:
@@ -349,29 +531,37 @@ def encode_task_list(values: List[str]) -> str:
 def decode_rewards(raw: Optional[str], length: int) -> List[List["RewardOut"]]:
     if not raw:
         return [[] for _ in range(length)]
+    return [
+        [RewardOut(title=title, count=count) for title, count in row]
+        for row in _decode_reward_rows(raw, length)
+    ]
+
+
+@functools.lru_cache(maxsize=512)
+def _decode_reward_rows(raw: str, length: int) -> Tuple[Tuple[Tuple[str, int], ...], ...]:
     try:
-        data = json.loads(raw)
+        data = json_loads(raw)
     except (json.JSONDecodeError, TypeError):
         data = []
     if not isinstance(data, list):
         data = []
-    rewards: List[List[RewardOut]] = []
-    for row in data:
-        if not isinstance(row, list):
-            rewards.append([])
+    rewards: List[Tuple[Tuple[str, int], ...]] = []
+    for row in data[:length]:
+        if not isinstance(row, list) or not row:
+            rewards.append(())
             continue
-        parsed_row: List[RewardOut] = []
+        parsed_row: List[Tuple[str, int]] = []
         for item in row:
             if not isinstance(item, dict):
                 continue
             title = str(item.get("title") or "").strip()
             count = parse_int(item.get("count"), default=0) or 0
             if title and count is not None:
-                parsed_row.append(RewardOut(title=title, count=count))
-        rewards.append(parsed_row)
+                parsed_row.append((title, count))
+        rewards.append(tuple(parsed_row))
     if len(rewards) < length:
-        rewards.extend([[] for _ in range(length - len(rewards))])
-    return rewards[:length]
+        rewards.extend([()] * (length - len(rewards)))
+    return tuple(rewards)
 
 
 def encode_rewards(rows: List[List["RewardIn"]]) -> str:
@@ -384,36 +574,57 @@ def encode_rewards(rows: List[List["RewardIn"]]) -> str:
                 if r.title.strip()
             ]
         )
-    return json.dumps(serializable, ensure_ascii=False)
+    return json_dumps(serializable)
 
 
-def _decode_state(raw: Optional[str], length: int) -> List[bool]:
+def _load_state(raw: Optional[str]) -> list:
     if not raw:
-        return [False] * length
+        return []
     try:
-        data = json.loads(raw)
+        data = json_loads(raw)
     except (json.JSONDecodeError, TypeError):
-        data = []
-    if not isinstance(data, list):
-        data = []
-    bools = [bool(x) for x in data][:length]
+        return []
+    return data if isinstance(data, list) else []
+
+
+def _decode_state(raw: Optional[str], length: int) -> List[bool]:
+    if not raw:
+        return [False] * length
+    return list(_state_bools(raw, length))
+
+
+@functools.lru_cache(maxsize=512)
+def _state_bools(raw: str, length: int) -> Tuple[bool, ...]:
+    bools = [bool(x) for x in _load_state(raw)[:length]]
     if len(bools) < length:
         bools.extend([False] * (length - len(bools)))
-    return bools
+    return tuple(bools)
 
 
 def _encode_state(values: List[bool]) -> str:
-    return json.dumps([bool(v) for v in values])
+    return json_dumps([bool(v) for v in values])
+
+
+@functools.lru_cache(maxsize=64)
+def _cleared_state(length: int) -> str:
+    return _encode_state([False] * length)
+
+
+def _resize_state(raw: Optional[str], length: int) -> str:
+    data = _load_state(raw)
+    if data and len(data) == length and all(type(x) is bool for x in data):
+        return raw
+    return _encode_state(_decode_state(raw, length))
 
 
 def _spending_reward_mode(spending: "Spending") -> str:
-    mode = (spending.reward_mode or "").upper()
-    if mode in {"DAILY", "ONCE", "DISABLED"}:
-        return mode
-    text = (spending.type or "").lower()
-    if "패스" in text:
-        return "ONCE"
-    return "DAILY"
+    mode = spending.reward_mode
+    if mode:
+        if mode not in REWARD_MODES:
+            mode = mode.upper()
+        if mode in REWARD_MODES:
+            return mode
+    return "ONCE" if "패스" in (spending.type or "") else "DAILY"
 
 
 def _spending_rewards(spending: "Spending") -> List["RewardOut"]:
@@ -457,7 +668,7 @@ class Game(Base):
 
     @property
     def playtime_days(self) -> int:
-        end_ref = self.end_date or dt.date.today()
+        end_ref = self.end_date or cached_today()
         days = (end_ref - self.start_date).days
         return max(days, 0)
 
@@ -481,6 +692,11 @@ class Character(Base):
 
     game = relationship("Game", back_populates="characters")
 
+    __table_args__ = (
+        Index("ix_char_game_have_title", "game_id", is_have.desc(), "title"),
+        Index("ix_char_game_title", "game_id", "title"),
+    )
+
 
 class Currency(Base):
     __tablename__ = "currencies"
@@ -488,13 +704,24 @@ class Currency(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     counts = Column(Integer, default=0, nullable=False)
-    timestamp = Column(DateTime(timezone=True), nullable=False, default=func.now())
+    timestamp = Column(UTCDateTime, nullable=False, default=func.now())
     type = Column(String, nullable=True)
     value = Column(Float, nullable=True)
     game_id = Column(Integer, ForeignKey("games.id"), nullable=False, index=True)
 
     game = relationship("Game", back_populates="currencies")
 
+    __table_args__ = (
+        Index(
+            "ix_curr_game_title_ts",
+            "game_id",
+            "title",
+            timestamp.desc(),
+            id.desc(),
+        ),
+        Index("ix_curr_game_ts_title", "game_id", "timestamp", "title"),
+    )
+
 
 class GameEvent(Base):
     __tablename__ = "game_events"
@@ -509,9 +736,14 @@ class GameEvent(Base):
 
     game = relationship("Game", back_populates="events")
 
+    __table_args__ = (
+        Index("ix_evt_game_start_id", "game_id", "start_date", "id"),
+        Index("ix_evt_game_title", "game_id", "title"),
+    )
+
     @property
     def state(self) -> str:
-        today = dt.date.today()
+        today = cached_today()
         if self.start_date and today < self.start_date:
             return "예정"
         if self.end_date and today > self.end_date:
@@ -531,20 +763,29 @@ class Spending(Base):
     expiration_days = Column(Integer, default=0, nullable=False)
     reward_mode = Column(String, nullable=True)
     reward_items = Column(String, nullable=True)
-    last_reward_at = Column(DateTime(timezone=True), nullable=True)
+    last_reward_at = Column(UTCDateTime, nullable=True)
     reward_once_granted = Column(Boolean, default=False, nullable=False)
     pass_current_level = Column(Integer, nullable=True)
     pass_max_level = Column(Integer, nullable=True)
 
     game = relationship("Game", back_populates="spendings")
 
+    __table_args__ = (
+        Index(
+            "ix_sp_game_next_paying",
+            "game_id",
+            func.julianday(paying_date) + expiration_days,
+            "id",
+        ),
+    )
+
     @property
     def next_paying_date(self) -> dt.date:
         return self.paying_date + dt.timedelta(days=self.expiration_days)
 
     @property
     def remain_date(self) -> int:
-        return (self.next_paying_date - dt.date.today()).days
+        return (self.next_paying_date - cached_today()).days
 
     @property
     def is_repaying(self) -> str:
@@ -575,9 +816,9 @@ class Task(Base):
     daily_state = Column(String, nullable=True)
     weekly_state = Column(String, nullable=True)
     monthly_state = Column(String, nullable=True)
-    last_daily_reset = Column(DateTime(timezone=True), nullable=True)
-    last_weekly_reset = Column(DateTime(timezone=True), nullable=True)
-    last_monthly_reset = Column(DateTime(timezone=True), nullable=True)
+    last_daily_reset = Column(UTCDateTime, nullable=True)
+    last_weekly_reset = Column(UTCDateTime, nullable=True)
+    last_monthly_reset = Column(UTCDateTime, nullable=True)
 
     game = relationship("Game", back_populates="tasks")
     histories = relationship(
@@ -593,7 +834,7 @@ class TaskHistory(Base):
     daily_done = Column(Integer, nullable=True)
     weekly_done = Column(Integer, nullable=True)
     monthly_done = Column(Integer, nullable=True)
-    timestamp = Column(DateTime(timezone=True), default=func.now(), nullable=False)
+    timestamp = Column(UTCDateTime, default=func.now(), nullable=False)
 
     task = relationship("Task", back_populates="histories")
 
@@ -605,9 +846,9 @@ class Item(Base):
     label = Column(String, nullable=False)
     gift_code = Column(String, nullable=True)
     state = Column(String, nullable=False, default="pending")
-    created_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
+    created_at = Column(UTCDateTime, default=func.now(), nullable=False)
     updated_at = Column(
-        DateTime(timezone=True),
+        UTCDateTime,
         default=func.now(),
         onupdate=func.now(),
         nullable=False,
@@ -627,114 +868,117 @@ class ClickEvent(Base):
     before_state = Column(String, nullable=True)
     after_state = Column(String, nullable=True)
     gift_code = Column(String, nullable=True)
-    created_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
+    created_at = Column(UTCDateTime, default=func.now(), nullable=False)
 
     item = relationship("Item", back_populates="events")
 
 
+class SeedMeta(Base):
+    __tablename__ = "seed_meta"
+
+    key = Column(String, primary_key=True)
+    fingerprint = Column(String, nullable=False)
+
+
 def init_db() -> None:
+    # PRAGMA user_version 이 최신이면 재시작 때 스키마 점검을 건너뜀
+    with engine.connect() as conn:
+        if conn.exec_driver_sql("PRAGMA user_version").scalar() == SCHEMA_VERSION:
+            return
     Base.metadata.create_all(bind=engine)
     ensure_columns()
 
 
+ADDED_COLUMNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "games": (
+        ("uid", "STRING"),
+        ("coupon_url", "STRING"),
+        ("gacha", "INTEGER DEFAULT 0"),
+        ("memo", "STRING"),
+        ("refresh_day", "INTEGER"),
+        ("refresh_time", "STRING"),
+    ),
+    "currencies": (
+        ("timestamp", "DATETIME"),
+        ("type", "STRING"),
+        ("value", "REAL"),
+    ),
+    "tasks": (
+        ("daily_rewards", "STRING"),
+        ("weekly_rewards", "STRING"),
+        ("monthly_rewards", "STRING"),
+        ("daily_reward_state", "STRING"),
+        ("weekly_reward_state", "STRING"),
+        ("monthly_reward_state", "STRING"),
+    ),
+    "spendings": (
+        ("reward_mode", "STRING"),
+        ("reward_items", "STRING"),
+        ("last_reward_at", "DATETIME"),
+        ("reward_once_granted", "BOOLEAN DEFAULT 0"),
+        ("pass_current_level", "INTEGER"),
+        ("pass_max_level", "INTEGER"),
+    ),
+}
+
+
 def ensure_columns() -> None:
     with engine.begin() as conn:
-        cols = {
-            row[1]
-            for row in conn.exec_driver_sql("PRAGMA table_info(games)").all()
-        }
-        if "uid" not in cols:
-            conn.exec_driver_sql("ALTER TABLE games ADD COLUMN uid STRING")
-        if "coupon_url" not in cols:
-            conn.exec_driver_sql("ALTER TABLE games ADD COLUMN coupon_url STRING")
-        if "gacha" not in cols:
-            conn.exec_driver_sql("ALTER TABLE games ADD COLUMN gacha INTEGER DEFAULT 0")
-        if "memo" not in cols:
-            conn.exec_driver_sql("ALTER TABLE games ADD COLUMN memo STRING")
-        if "refresh_day" not in cols:
-            conn.exec_driver_sql("ALTER TABLE games ADD COLUMN refresh_day INTEGER")
-        if "refresh_time" not in cols:
-            conn.exec_driver_sql("ALTER TABLE games ADD COLUMN refresh_time STRING")
-        ccols = {
-            row[1]
-            for row in conn.exec_driver_sql("PRAGMA table_info(currencies)").all()
-        }
-        if "timestamp" not in ccols:
-            conn.exec_driver_sql(
-                "ALTER TABLE currencies ADD COLUMN timestamp DATETIME"
-            )
-        if "type" not in ccols:
-            conn.exec_driver_sql("ALTER TABLE currencies ADD COLUMN type STRING")
-        if "value" not in ccols:
-            conn.exec_driver_sql("ALTER TABLE currencies ADD COLUMN value REAL")
-        tcols = {
-            row[1]
-            for row in conn.exec_driver_sql("PRAGMA table_info(tasks)").all()
-        }
-        if "daily_rewards" not in tcols:
-            conn.exec_driver_sql("ALTER TABLE tasks ADD COLUMN daily_rewards STRING")
-        if "weekly_rewards" not in tcols:
-            conn.exec_driver_sql("ALTER TABLE tasks ADD COLUMN weekly_rewards STRING")
-        if "monthly_rewards" not in tcols:
-            conn.exec_driver_sql("ALTER TABLE tasks ADD COLUMN monthly_rewards STRING")
-        if "daily_reward_state" not in tcols:
-            conn.exec_driver_sql("ALTER TABLE tasks ADD COLUMN daily_reward_state STRING")
-        if "weekly_reward_state" not in tcols:
-            conn.exec_driver_sql("ALTER TABLE tasks ADD COLUMN weekly_reward_state STRING")
-        if "monthly_reward_state" not in tcols:
-            conn.exec_driver_sql("ALTER TABLE tasks ADD COLUMN monthly_reward_state STRING")
-        spcols = {
-            row[1]
-            for row in conn.exec_driver_sql("PRAGMA table_info(spendings)").all()
-        }
-        if "reward_mode" not in spcols:
-            conn.exec_driver_sql("ALTER TABLE spendings ADD COLUMN reward_mode STRING")
-        if "reward_items" not in spcols:
-            conn.exec_driver_sql("ALTER TABLE spendings ADD COLUMN reward_items STRING")
-        if "last_reward_at" not in spcols:
-            conn.exec_driver_sql("ALTER TABLE spendings ADD COLUMN last_reward_at DATETIME")
-        if "reward_once_granted" not in spcols:
-            conn.exec_driver_sql("ALTER TABLE spendings ADD COLUMN reward_once_granted BOOLEAN DEFAULT 0")
-        if "pass_current_level" not in spcols:
-            conn.exec_driver_sql("ALTER TABLE spendings ADD COLUMN pass_current_level INTEGER")
-        if "pass_max_level" not in spcols:
-            conn.exec_driver_sql("ALTER TABLE spendings ADD COLUMN pass_max_level INTEGER")
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+            for name, ddl in columns:
+                if name not in existing:
+                    conn.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}")
+        for table in Base.metadata.sorted_tables:
+            indexed = {row[1] for row in conn.exec_driver_sql(f"PRAGMA index_list({table.name})")}
+            for index in table.indexes:
+                if index.name not in indexed:
+                    index.create(conn)
+        conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _cell(row: Sequence[str], idx: Optional[int]) -> Optional[str]:
+    if idx is None:
+        return None
+    return row[idx] if idx < len(row) else ""
 
 
 def seed_games(db: Session) -> Dict[str, Game]:
-    path = FILES_DIR / "GameDB.xlsx"
-    rows = load_xlsx_rows(path)
+    sheet = load_xlsx_rows(FILES_DIR / "GameDB.xlsx")
+    headers: Sequence[str] = sheet[0] if sheet else ("Title", "StartDate", "EndDate")
+    col = {name: idx for idx, name in enumerate(headers)}
     extra_rows = [
         {"Title": "엘든링", "StartDate": "2022년 4월 16일", "EndDate": "2024년 7월 14일"},
         {"Title": "할로우나이트:실크송", "StartDate": "2025년 9월 9일", "EndDate": "2025년 10월 1일"},
         {"Title": "발더스게이트3", "StartDate": "2024년 8월 10일", "EndDate": "2025년 1월 9일"},
     ]
-    if not rows:
-        rows = []
-    else:
-        headers = rows[0]
-        header_len = len(headers)
-        body = rows[1:]
-        rows = [dict(zip(headers, (r + [""] * (header_len - len(r)))[:header_len])) for r in body]
-    rows.extend(extra_rows)
+    rows = itertools.chain(
+        itertools.islice(sheet, 1, None),
+        (tuple(extra.get(name, "") for name in headers) for extra in extra_rows),
+    )
+    title_i, start_i, end_i = col.get("Title"), col.get("StartDate"), col.get("EndDate")
+    stop_i, uid_i, coupon_i = col.get("StopPlay"), col.get("UID"), col.get("CouponURL")
+    gacha_i, memo_i = col.get("Gacha"), col.get("Memo")
+    day_i, time_i = col.get("RefreshDay"), col.get("RefreshTime")
     games: Dict[str, Game] = {}
+    existing = {g.title: g for g in db.execute(select(Game)).scalars()}
     seen_titles = set()
     for row in rows:
-        title = row.get("Title")
+        title = _cell(row, title_i)
         if not title:
             continue
         if title in seen_titles:
             continue
         seen_titles.add(title)
-        start_date = parse_date_value(row.get("StartDate"))
-        end_date = parse_date_value(row.get("EndDate"))
-        stop_play = parse_bool(row.get("StopPlay"), default=False)
-        uid = row.get("UID") or None
-        coupon_url = row.get("CouponURL") or None
-        gacha_cost = parse_int(row.get("Gacha"), default=0) or 0
-        memo = row.get("Memo") or None
-        refresh_day = parse_refresh_day(row.get("RefreshDay"))
-        refresh_time = parse_time_value(row.get("RefreshTime"))
+        start_date = parse_date_value(_cell(row, start_i))
+        end_date = parse_date_value(_cell(row, end_i))
+        stop_play = parse_bool(_cell(row, stop_i), default=False)
+        uid = _cell(row, uid_i) or None
+        coupon_url = _cell(row, coupon_i) or None
+        gacha_cost = parse_int(_cell(row, gacha_i), default=0) or 0
+        memo = _cell(row, memo_i) or None
+        refresh_day = parse_refresh_day(_cell(row, day_i))
+        refresh_time = parse_time_value(_cell(row, time_i))
         if title in REFRESH_DEFAULTS:
             def_day, def_time = REFRESH_DEFAULTS[title]
             refresh_day = refresh_day or def_day
@@ -743,7 +987,7 @@ def seed_games(db: Session) -> Dict[str, Game]:
             continue
         if end_date:
             stop_play = True
-        game = db.execute(select(Game).where(Game.title == title)).scalar_one_or_none()
+        game = existing.get(title)
         if not game:
             game = Game(
                 title=title, start_date=start_date, end_date=end_date, stop_play=stop_play
@@ -766,8 +1010,21 @@ def seed_games(db: Session) -> Dict[str, Game]:
     return games
 
 
+def _prefetch_ids_by_game_title(db: Session, model, games: Dict[str, Game]) -> Dict[Tuple[int, str], int]:
+    game_ids = [g.id for g in games.values()]
+    rows = db.execute(select(model.game_id, model.title, model.id).where(model.game_id.in_(game_ids)))
+    return {(game_id, title): row_id for game_id, title, row_id in rows}
+
+
+def _prefetch_game_title_keys(db: Session, model, games: Dict[str, Game]) -> Set[Tuple[int, str]]:
+    game_ids = [g.id for g in games.values()]
+    return set(db.execute(select(model.game_id, model.title).where(model.game_id.in_(game_ids))).all())
+
+
 def seed_characters(db: Session, games: Dict[str, Game]) -> None:
     rows = read_csv_rows(FILES_DIR / "CharacterDB.csv")
+    existing = _prefetch_game_title_keys(db, Character, games)
+    payload: List[Dict[str, object]] = []
     for row in rows:
         title = row.get("Title")
         game_title = row.get("GameDB")
@@ -776,27 +1033,29 @@ def seed_characters(db: Session, games: Dict[str, Game]) -> None:
         game = games.get(game_title)
         if not game:
             continue
-        character = db.execute(
-            select(Character).where(
-                Character.title == title, Character.game_id == game.id
-            )
-        ).scalar_one_or_none()
-        if character:
+        if (game.id, title) in existing:
             # 기존 유저 수정값을 덮어쓰지 않기 위해 seed는 신규 캐릭터만 추가
             continue
-        character = Character(title=title, game=game)
-        db.add(character)
-        character.level = parse_int(row.get("Level"))
-        character.grade = row.get("Grade") or None
-        character.overpower = parse_int(row.get("Overpower"), default=0) or 0
-        character.position = row.get("Position") or None
-        character.memo = row.get("Memo") or None
-        character.is_have = parse_bool(row.get("isHave"), default=True)
-    db.flush()
+        existing.add((game.id, title))
+        payload.append(
+            {
+                "title": title,
+                "game_id": game.id,
+                "level": parse_int(row.get("Level")),
+                "grade": row.get("Grade") or None,
+                "overpower": parse_int(row.get("Overpower"), default=0) or 0,
+                "position": row.get("Position") or None,
+                "memo": row.get("Memo") or None,
+                "is_have": parse_bool(row.get("isHave"), default=True),
+            }
+        )
+    if payload:
+        db.execute(insert(Character), payload)
 
 
 def seed_currencies(db: Session, games: Dict[str, Game]) -> None:
     rows = read_csv_rows(FILES_DIR / "CurrencyDB.csv")
+    payload: List[Dict[str, object]] = []
     for row in rows:
         title = row.get("Title")
         game_title = row.get("GameDB")
@@ -810,20 +1069,25 @@ def seed_currencies(db: Session, games: Dict[str, Game]) -> None:
         value = parse_float(row.get("Value"), default=1) or 1
         ts_date = parse_date_value(row.get("lateDate")) or dt.date.today()
         ts = dt.datetime.combine(ts_date, dt.time.min, dt.timezone.utc)
-        entry = Currency(
-            title=title,
-            game=game,
-            counts=counts,
-            timestamp=ts,
-            type=ctype,
-            value=value,
+        payload.append(
+            {
+                "title": title,
+                "game_id": game.id,
+                "counts": counts,
+                "timestamp": ts,
+                "type": ctype,
+                "value": value,
+            }
         )
-        db.add(entry)
-    db.flush()
+    if payload:
+        db.execute(insert(Currency), payload)
+        mark_timeseries_stale(db)
 
 
 def seed_game_events(db: Session, games: Dict[str, Game]) -> None:
     rows = read_csv_rows(FILES_DIR / "EventDB.csv")
+    existing = _prefetch_game_title_keys(db, GameEvent, games)
+    payload: List[Dict[str, object]] = []
     for row in rows:
         title = row.get("Title")
         game_title = row.get("GameDB")
@@ -832,33 +1096,29 @@ def seed_game_events(db: Session, games: Dict[str, Game]) -> None:
         game = games.get(game_title)
         if not game:
             continue
-        start_date = parse_date_value(row.get("StartDate")) or dt.date.today()
-        end_date = parse_date_value(row.get("EndDate"))
-        evt_type = row.get("Type") or ""
-        priority = row.get("Priority") or ""
-        event = (
-            db.execute(
-                select(GameEvent)
-                .where(GameEvent.title == title, GameEvent.game_id == game.id)
-                .limit(1)
-            )
-            .scalars()
-            .first()
-        )
-        if event:
+        if (game.id, title) in existing:
             # 사용자 수정 이벤트를 덮어쓰지 않음
             continue
-        event = GameEvent(title=title, game=game)
-        db.add(event)
-        event.type = evt_type
-        event.start_date = start_date
-        event.end_date = end_date
-        event.priority = priority
-    db.flush()
+        existing.add((game.id, title))
+        payload.append(
+            {
+                "title": title,
+                "game_id": game.id,
+                "type": row.get("Type") or "",
+                "start_date": parse_date_value(row.get("StartDate")) or dt.date.today(),
+                "end_date": parse_date_value(row.get("EndDate")),
+                "priority": row.get("Priority") or "",
+            }
+        )
+    if payload:
+        db.execute(insert(GameEvent), payload)
 
 
 def seed_spendings(db: Session, games: Dict[str, Game]) -> None:
     rows = read_csv_rows(FILES_DIR / "SpendingDB.csv")
+    existing = _prefetch_ids_by_game_title(db, Spending, games)
+    pending: Dict[Tuple[int, str], Dict[str, object]] = {}
+    updates: Dict[int, Dict[str, object]] = {}
     for row in rows:
         title = row.get("Title")
         game_title = row.get("GameDB")
@@ -867,70 +1127,111 @@ def seed_spendings(db: Session, games: Dict[str, Game]) -> None:
         game = games.get(game_title)
         if not game:
             continue
-        paying_date = parse_date_value(row.get("PayingDate")) or dt.date.today()
-        expiration_days = parse_int(row.get("ExpirationDate"), default=0) or 0
-        spending = db.execute(
-            select(Spending).where(
-                Spending.title == title, Spending.game_id == game.id
-            )
-        ).scalar_one_or_none()
-        if not spending:
-            spending = Spending(title=title, game=game)
-            db.add(spending)
-        spending.paying = row.get("Paying") or ""
-        spending.type = row.get("Type") or ""
-        spending.paying_date = paying_date
-        spending.expiration_days = expiration_days
+        values = {
+            "paying": row.get("Paying") or "",
+            "type": row.get("Type") or "",
+            "paying_date": parse_date_value(row.get("PayingDate")) or dt.date.today(),
+            "expiration_days": parse_int(row.get("ExpirationDate"), default=0) or 0,
+        }
+        spending_id = existing.get((game.id, title))
+        if spending_id is not None:
+            updates.setdefault(spending_id, {"id": spending_id}).update(values)
+        else:
+            pending.setdefault((game.id, title), {"title": title, "game_id": game.id}).update(values)
+    if updates:
+        db.execute(update(Spending), list(updates.values()))
+    if pending:
+        db.execute(insert(Spending), list(pending.values()))
     db.flush()
 
 
-def seed_tasks(db: Session, games: Dict[str, Game]) -> Dict[str, Task]:
-    path = FILES_DIR / "TaskDB.xlsx"
-    rows = load_xlsx_rows(path)
-    if not rows:
-        return {}
-    headers = rows[0]
-    header_len = len(headers)
-    body = rows[1:]
-    row_dicts = [
-        dict(zip(headers, (r + [""] * (header_len - len(r)))[:header_len]))
-        for r in body
-    ]
-    tasks: Dict[str, Task] = {}
+def seed_tasks(db: Session, games: Dict[str, Game]) -> None:
     now = dt.datetime.now(dt.timezone.utc)
-    for row in row_dicts:
+    game_ids = [g.id for g in games.values()]
+    existing = {
+        row["game_id"]: row
+        for row in db.execute(
+            select(
+                Task.id,
+                Task.game_id,
+                Task.daily_state,
+                Task.weekly_state,
+                Task.monthly_state,
+                Task.last_daily_reset,
+                Task.last_weekly_reset,
+                Task.last_monthly_reset,
+            ).where(Task.game_id.in_(game_ids))
+        ).mappings()
+    }
+    pending: Dict[int, Dict[str, object]] = {}
+    updates: Dict[int, Dict[str, object]] = {}
+    for row in iter_xlsx_records(FILES_DIR / "TaskDB.xlsx"):
         game_title = row.get("GameDB")
         if not game_title:
             continue
         game = games.get(game_title)
         if not game:
             continue
-        daily_list = parse_task_list(row.get("DailyTask"))
-        weekly_list = parse_task_list(row.get("WeeklyTask"))
-        monthly_list = parse_task_list(row.get("MonthlyTask"))
-        task = db.execute(select(Task).where(Task.game_id == game.id)).scalar_one_or_none()
-        if not task:
-            task = Task(game=game)
-            db.add(task)
-        task.daily_tasks = ";".join(daily_list) if daily_list else None
-        task.weekly_tasks = ";".join(weekly_list) if weekly_list else None
-        task.monthly_tasks = ";".join(monthly_list) if monthly_list else None
-        task.daily_state = _encode_state(_decode_state(task.daily_state, len(daily_list)))
-        task.weekly_state = _encode_state(_decode_state(task.weekly_state, len(weekly_list)))
-        task.monthly_state = _encode_state(_decode_state(task.monthly_state, len(monthly_list)))
-        task.last_daily_reset = task.last_daily_reset or now
-        task.last_weekly_reset = task.last_weekly_reset or now
-        task.last_monthly_reset = task.last_monthly_reset or now
-        tasks[game_title] = task
+        lists = (
+            parse_task_list(row.get("DailyTask")),
+            parse_task_list(row.get("WeeklyTask")),
+            parse_task_list(row.get("MonthlyTask")),
+        )
+        stored = existing.get(game.id)
+        if stored is not None:
+            current = updates.setdefault(
+                stored["id"],
+                {
+                    "id": stored["id"],
+                    "daily_state": stored["daily_state"],
+                    "weekly_state": stored["weekly_state"],
+                    "monthly_state": stored["monthly_state"],
+                    "last_daily_reset": stored["last_daily_reset"] or now,
+                    "last_weekly_reset": stored["last_weekly_reset"] or now,
+                    "last_monthly_reset": stored["last_monthly_reset"] or now,
+                },
+            )
+        else:
+            current = pending.setdefault(
+                game.id,
+                {
+                    "game_id": game.id,
+                    "last_daily_reset": now,
+                    "last_weekly_reset": now,
+                    "last_monthly_reset": now,
+                },
+            )
+        for period, items in zip(("daily", "weekly", "monthly"), lists):
+            current[f"{period}_tasks"] = ";".join(items) if items else None
+            current[f"{period}_state"] = _resize_state(current.get(f"{period}_state"), len(items))
+    if updates:
+        db.execute(update(Task), list(updates.values()))
+    if pending:
+        db.execute(insert(Task), list(pending.values()))
     db.flush()
-    return tasks
+
+
+def seed_fingerprint() -> str:
+    digest = hashlib.sha256(f"seed-v{SEED_VERSION}".encode())
+    for path in sorted(FILES_DIR.iterdir()):
+        if path.suffix.lower() not in {".xlsx", ".csv"}:
+            continue
+        with path.open("rb") as f:
+            file_hash = hashlib.file_digest(f, "sha256").digest()
+        digest.update(path.name.encode())
+        digest.update(file_hash)
+    return digest.hexdigest()
 
 
 def seed_data_from_files() -> None:
     if not FILES_DIR.exists():
         return
+    fingerprint = seed_fingerprint()
     db = SessionLocal()
     try:
+        meta = db.get(SeedMeta, "files")
+        if meta is not None and meta.fingerprint == fingerprint:
+            return
         games = seed_games(db)
         if games:
             seed_characters(db, games)
@@ -939,6 +1240,7 @@ def seed_data_from_files() -> None:
             seed_spendings(db, games)
             seed_tasks(db, games)
         backfill_seed_defaults(db)
+        db.merge(SeedMeta(key="files", fingerprint=fingerprint))
         db.commit()
     finally:
         db.close()
@@ -1049,7 +1351,7 @@ def decode_reward_list(raw: Optional[str]) -> List["RewardOut"]:
     if not raw:
         return []
     try:
-        data = json.loads(raw)
+        data = json_loads(raw)
     except (json.JSONDecodeError, TypeError):
         data = []
     if not isinstance(data, list):
@@ -1071,7 +1373,7 @@ def encode_reward_list(rows: List["RewardIn"]) -> str:
         if not r.title.strip():
             continue
         serializable.append({"title": r.title.strip(), "count": int(r.count)})
-    return json.dumps(serializable, ensure_ascii=False)
+    return json_dumps(serializable)
 
 
 class GameOut(BaseModel):
@@ -1103,10 +1405,6 @@ class GameOut(BaseModel):
             return None
         return str(v)
 
-    @field_serializer("uid")
-    def serialize_uid(self, value):
-        return str(value) if value is not None else None
-
     @field_serializer("refresh_time")
     def serialize_refresh_time(self, value):
         if value is None:
@@ -1227,6 +1525,24 @@ TaskUpdate.model_rebuild()
 SpendingOut.model_rebuild()
 SpendingConfigUpdate.model_rebuild()
 
+ITEM_LIST = TypeAdapter(List[ItemOut])
+GAME_LIST = TypeAdapter(List[GameOut])
+CHARACTER_LIST = TypeAdapter(List[CharacterOut])
+CURRENCY_LIST = TypeAdapter(List[CurrencyOut])
+GAME_EVENT_LIST = TypeAdapter(List[GameEventOut])
+SPENDING_LIST = TypeAdapter(List[SpendingOut])
+
+
+def list_response(adapter: TypeAdapter, rows) -> Response:
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(rows, from_attributes=True)),
+        media_type="application/json",
+    )
+
+
+def model_response(model: BaseModel) -> Response:
+    return Response(content=model.model_dump_json(), media_type="application/json")
+
 
 class CurrencyAdjust(BaseModel):
     counts: int = Field(..., description="설정할 재화 수량 (증감이 아닌 절댓값)")
@@ -1288,25 +1604,120 @@ class SimpleRateLimiter:
     def __init__(self, limit: int, window_seconds: int):
         self.limit = max(1, limit)
         self.window = max(1, window_seconds)
-        self.hits: Dict[str, deque] = {}
+        self.hits: Dict[str, array] = {}
+        self.heads: Dict[str, int] = {}
         self.lock = threading.Lock()
+        self.calls = 0
+
+    def _sweep(self, now: float) -> None:
+        limit = self.limit
+        for key in [
+            k for k, ring in self.hits.items() if now - ring[(self.heads[k] - 1) % limit] > self.window
+        ]:
+            del self.hits[key]
+            del self.heads[key]
 
     def allow(self, key: str) -> Tuple[bool, int]:
         now = time.time()
         with self.lock:
-            q = self.hits.get(key)
-            if q is None:
-                q = deque()
-                self.hits[key] = q
-            while q and now - q[0] > self.window:
-                q.popleft()
-            if len(q) >= self.limit:
-                retry_after = int(self.window - (now - q[0]))
-                return False, max(retry_after, 1)
-            q.append(now)
+            self.calls += 1
+            if self.calls % RATE_LIMIT_SWEEP_EVERY == 0:
+                self._sweep(now)
+            ring = self.hits.get(key)
+            if ring is None:
+                ring = self.hits[key] = array("d", [0.0]) * self.limit
+                self.heads[key] = 0
+            head = self.heads[key]
+            elapsed = now - ring[head]
+            if elapsed <= self.window:
+                return False, max(int(self.window - elapsed), 1)
+            ring[head] = now
+            self.heads[key] = (head + 1) % self.limit
             return True, 0
 
 
+class GameTTLCache:
+    # 대시보드 폴링용 짧은 TTL 캐시, 재화 기록이 바뀌면 게임 단위로 비운다.
+    def __init__(self, ttl_seconds: float):
+        self.ttl = ttl_seconds
+        self.entries: Dict[int, Dict[tuple, Tuple[float, object]]] = {}
+        self.inflight: Dict[Tuple[int, tuple], Future] = {}
+        self.epoch = 0
+        self.lock = threading.Lock()
+
+    def get(self, game_id: int, key: tuple) -> Optional[object]:
+        with self.lock:
+            hit = self.entries.get(game_id, {}).get(key)
+        if hit is None or hit[0] < time.monotonic():
+            return None
+        return hit[1]
+
+    def put(self, game_id: int, key: tuple, value: object, epoch: Optional[int] = None) -> None:
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        with self.lock:
+            if epoch is not None and epoch != self.epoch:
+                return
+            bucket = self.entries.setdefault(game_id, {})
+            for stale in [k for k, (expires, _) in bucket.items() if expires < now]:
+                del bucket[stale]
+            bucket[key] = (now + self.ttl, value)
+
+    def get_or_build(self, game_id: int, key: tuple, build: Callable[[], object]) -> object:
+        value = self.get(game_id, key)
+        if value is not None:
+            return value
+        flight_key = (game_id, key)
+        with self.lock:
+            future = self.inflight.get(flight_key)
+            leader = future is None
+            if leader:
+                future = self.inflight[flight_key] = Future()
+                epoch = self.epoch
+        if not leader:
+            return future.result()
+        try:
+            value = build()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            self.put(game_id, key, value, epoch)
+            future.set_result(value)
+        finally:
+            with self.lock:
+                self.inflight.pop(flight_key, None)
+        return value
+
+    def invalidate(self, game_id: Optional[int] = None) -> None:
+        with self.lock:
+            self.epoch += 1
+            if game_id is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(game_id, None)
+
+
+TIMESERIES_CACHE = GameTTLCache(TIMESERIES_CACHE_TTL)
+
+
+def mark_timeseries_stale(db: Session, game_id: Optional[int] = None) -> None:
+    # 커밋 전에 비우면 그 사이 요청이 옛 데이터를 새 epoch 로 캐시하므로 커밋 후에 비운다
+    db.info.setdefault("stale_timeseries", set()).add(game_id)
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _invalidate_committed_timeseries(session: Session) -> None:
+    for game_id in session.info.pop("stale_timeseries", ()):
+        TIMESERIES_CACHE.invalidate(game_id)
+
+
+@event.listens_for(SessionLocal, "after_soft_rollback")
+def _forget_rolled_back_timeseries(session: Session, _previous_transaction) -> None:
+    session.info.pop("stale_timeseries", None)
+
+
 class RateLimitMiddleware(BaseHTTPMiddleware):
     def __init__(self, app: FastAPI):
         super().__init__(app)
@@ -1319,17 +1730,14 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         client_ip = "unknown"
         if request.client and request.client.host:
             client_ip = request.client.host
-        method = request.method.upper()
-        allowed, retry_after = self.all_limiter.allow(f"{client_ip}:all")
+        allowed, retry_after = self.all_limiter.allow(client_ip)
         if not allowed:
             return JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={"detail": "Too many requests", "retry_after": retry_after},
             )
-        if method in {"POST", "PUT", "PATCH", "DELETE"}:
-            allowed_mut, retry_after_mut = self.mutation_limiter.allow(
-                f"{client_ip}:mut"
-            )
+        if request.method in MUTATION_METHODS:
+            allowed_mut, retry_after_mut = self.mutation_limiter.allow(client_ip)
             if not allowed_mut:
                 return JSONResponse(
                     status_code=status.HTTP_429_TOO_MANY_REQUESTS,
@@ -1352,7 +1760,50 @@ def require_admin_token(request: Request):
         )
 
 
-app = FastAPI(title="Dashboard Backend", version="0.2.0")
+StaticAsset = Tuple[bytes, str]
+
+
+def load_static_asset(path: Path) -> Optional[StaticAsset]:
+    try:
+        body = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return body, f'"{hashlib.blake2s(body, digest_size=16).hexdigest()}"'
+
+
+SERVICE_WORKER: Optional[StaticAsset] = None
+INDEX_PAGE: Optional[StaticAsset] = None
+
+
+def load_static_assets() -> None:
+    global SERVICE_WORKER, INDEX_PAGE
+    SERVICE_WORKER = load_static_asset(SW_PATH)
+    INDEX_PAGE = load_static_asset(INDEX_PATH)
+
+
+def static_asset_response(request: Request, asset: StaticAsset, media_type: str) -> Response:
+    body, etag = asset
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    await asyncio.to_thread(init_db)
+    await asyncio.to_thread(seed_data_from_files)
+    load_static_assets()
+    yield
+
+
+app = FastAPI(
+    title="Dashboard Backend",
+    version="0.2.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse if HAS_ORJSON else JSONResponse,
+)
 app.add_middleware(RateLimitMiddleware)
 
 if STATIC_DIR.exists():
@@ -1362,15 +1813,10 @@ if IMAGE_DIR.exists():
 
 
 @app.get("/service-worker.js", include_in_schema=False)
-def service_worker():
-    if not SW_PATH.exists():
+def service_worker(request: Request):
+    if SERVICE_WORKER is None:
         raise HTTPException(status_code=404)
-    return FileResponse(SW_PATH, media_type="application/javascript")
-
-@app.on_event("startup")
-def on_startup():
-    init_db()
-    seed_data_from_files()
+    return static_asset_response(request, SERVICE_WORKER, "application/javascript")
 
 
 @app.get("/health")
@@ -1390,17 +1836,23 @@ def verify_admin(_: None = Depends(require_admin_token)):
     dependencies=[Depends(require_admin_token)],
 )
 def create_item(payload: ItemCreate, db: Session = Depends(get_db)):
-    item = Item(label=payload.label, gift_code=payload.gift_code, state=payload.state)
+    now = dt.datetime.now(dt.timezone.utc)
+    item = Item(
+        label=payload.label,
+        gift_code=payload.gift_code,
+        state=payload.state,
+        created_at=now,
+        updated_at=now,
+    )
     db.add(item)
     db.commit()
-    db.refresh(item)
     return item
 
 
 @app.get("/items", response_model=List[ItemOut])
 def list_items(db: Session = Depends(get_db)):
     result = db.execute(select(Item).order_by(Item.id.asc()))
-    return result.scalars().all()
+    return list_response(ITEM_LIST, result.scalars().all())
 
 
 @app.post(
@@ -1413,11 +1865,13 @@ def click_action(payload: ActionPayload, db: Session = Depends(get_db)):
     if not item:
         raise HTTPException(status_code=404, detail="Item not found")
 
+    now = dt.datetime.now(dt.timezone.utc)
     before_state = item.state
     if payload.next_state:
         item.state = payload.next_state
     if payload.gift_code:
         item.gift_code = payload.gift_code
+    item.updated_at = now
 
     event = ClickEvent(
         item=item,
@@ -1425,10 +1879,10 @@ def click_action(payload: ActionPayload, db: Session = Depends(get_db)):
         before_state=before_state,
         after_state=item.state,
         gift_code=item.gift_code,
+        created_at=now,
     )
     db.add(event)
     db.commit()
-    db.refresh(item)
     return item
 
 
@@ -1443,13 +1897,14 @@ def weekly_metrics(db: Session = Depends(get_db)):
         .where(ClickEvent.created_at >= start_dt)
         .group_by("d")
     )
-    rows = db.execute(bucket_query).all()
-    counts_by_date = {dt.date.fromisoformat(row[0]): row[1] for row in rows}
+    counts_by_date: Dict[str, int] = defaultdict(int)
+    for day_text, count in db.execute(bucket_query):
+        counts_by_date[day_text] += count
 
-    buckets: List[WeeklyBucket] = []
-    for i in range(7):
-        day = start_date + dt.timedelta(days=i)
-        buckets.append(WeeklyBucket(date=day, count=counts_by_date.get(day, 0)))
+    buckets = [
+        WeeklyBucket.model_construct(date=day, count=counts_by_date.get(day.isoformat(), 0))
+        for day in _bucket_dates(start_date, 7, 1)
+    ]
 
     return WeeklyMetrics(buckets=buckets, from_date=start_date, to_date=today)
 
@@ -1457,7 +1912,7 @@ def weekly_metrics(db: Session = Depends(get_db)):
 @app.get("/dashboard/alerts", response_model=DashboardAlert)
 def dashboard_alerts(db: Session = Depends(get_db)):
     today = today_local()
-    games = db.execute(select(Game)).scalars().all()
+    games = db.execute(select(Game.title, Game.refresh_day).order_by(Game.title.asc())).all()
     rows = db.execute(
         select(GameEvent, Game.title)
         .join(Game, Game.id == GameEvent.game_id)
@@ -1498,12 +1953,10 @@ def dashboard_alerts(db: Session = Depends(get_db)):
             )
 
     refresh_map: dict[int, List[str]] = {i: [] for i in range(1, 8)}
-    for g in games:
-        refresh_day, _ = _game_refresh_info(g)
+    for title, refresh_day in games:
+        refresh_day = refresh_day or REFRESH_DEFAULTS.get(title, (None, None))[0]
         if refresh_day:
-            refresh_map.setdefault(refresh_day, []).append(g.title)
-    for titles in refresh_map.values():
-        titles.sort()
+            refresh_map.setdefault(refresh_day, []).append(title)
 
     tomorrow = today + dt.timedelta(days=1)
     # convert python weekday (Mon=0) to desired format (Sun=1)
@@ -1528,14 +1981,18 @@ def list_games(
     during_play_only: bool = False,
     include_stopped: bool = True,
     db: Session = Depends(get_db),
-) -> List[Game]:
-    query = select(Game)
+) -> Response:
+    playtime_days = func.max(
+        func.julianday(func.coalesce(Game.end_date, func.date("now", "localtime")))
+        - func.julianday(Game.start_date),
+        0,
+    )
+    query = select(Game).order_by(Game.stop_play.asc(), playtime_days.desc(), Game.id.asc())
     if not include_stopped:
         query = query.where(Game.stop_play.is_(False))
     if during_play_only:
         query = query.where(Game.end_date.is_(None))
     games = list(db.execute(query).scalars().all())
-    games.sort(key=lambda g: (g.stop_play, -g.playtime_days))
     game_ids = [g.id for g in games]
 
     tasks_by_game: Dict[int, Task] = {}
@@ -1547,20 +2004,24 @@ def list_games(
     if game_ids:
         rows = (
             db.execute(
-                select(Currency)
-                .where(Currency.game_id.in_(game_ids))
-                .order_by(Currency.game_id.asc(), Currency.title.asc(), Currency.timestamp.desc(), Currency.id.desc())
+                latest_currency_query(Currency.game_id.in_(game_ids)).order_by(
+                    Currency.game_id.asc(), Currency.title.asc()
+                )
             )
             .scalars()
             .all()
         )
-        temp: Dict[Tuple[int, str], Currency] = {}
-        for r in rows:
-            key = (r.game_id, r.title)
-            if key not in temp:
-                temp[key] = r
-        for (gid, _), cur in temp.items():
-            currency_latest.setdefault(gid, []).append(cur)
+        for cur in rows:
+            currency_latest.setdefault(cur.game_id, []).append(cur)
+
+    spendings_by_game: Dict[int, List[Spending]] = defaultdict(list)
+    if game_ids:
+        for sp in db.execute(
+            select(Spending).where(
+                Spending.game_id.in_(game_ids), *_spending_reward_candidates(today_local())
+            )
+        ).scalars():
+            spendings_by_game[sp.game_id].append(sp)
 
     changed = False
     for g in games:
@@ -1570,9 +2031,9 @@ def list_games(
         g.gacha_pull_message = pull_msg
         task = tasks_by_game.get(g.id)
         if task:
-            changed = _ensure_task_resets(task, g, db) or changed
-            lists = _task_lists(task)
-            states = _task_states(task, lists)
+            reset, decoded = _ensure_task_resets(task, g, db, flush=False)
+            changed = reset or changed
+            states = decoded.states
             g.daily_complete = bool(states[0]) and all(states[0])
             g.weekly_complete = bool(states[1]) and all(states[1])
             g.monthly_complete = bool(states[2]) and all(states[2])
@@ -1580,10 +2041,12 @@ def list_games(
             g.daily_complete = False
             g.weekly_complete = False
             g.monthly_complete = False
-        changed = _apply_spending_rewards(g, db) or changed
+        changed = (
+            _apply_spending_rewards(g, db, spendings_by_game[g.id], latest_cur, flush=False) or changed
+        )
     if changed:
         db.commit()
-    return games
+    return list_response(GAME_LIST, games)
 
 
 def get_game_or_404(game_id: int, db: Session) -> Game:
@@ -1593,21 +2056,31 @@ def get_game_or_404(game_id: int, db: Session) -> Game:
     return game
 
 
+def latest_currency_query(*criteria):
+    ranked = (
+        select(
+            Currency.id,
+            func.row_number()
+            .over(
+                partition_by=(Currency.game_id, Currency.title),
+                order_by=(Currency.timestamp.desc(), Currency.id.desc()),
+            )
+            .label("rn"),
+        )
+        .where(*criteria)
+        .subquery()
+    )
+    return select(Currency).join(ranked, ranked.c.id == Currency.id).where(ranked.c.rn == 1)
+
+
 def get_latest_currencies(db: Session, game: Game) -> List[Currency]:
-    rows = (
+    return list(
         db.execute(
-            select(Currency)
-            .where(Currency.game_id == game.id)
-            .order_by(Currency.title.asc(), Currency.timestamp.desc(), Currency.id.desc())
+            latest_currency_query(Currency.game_id == game.id).order_by(Currency.title.asc())
         )
         .scalars()
         .all()
     )
-    latest_by_title = {}
-    for r in rows:
-        if r.title not in latest_by_title:
-            latest_by_title[r.title] = r
-    return list(latest_by_title.values())
 
 
 def get_task_or_404(game_id: int, db: Session) -> Task:
@@ -1627,9 +2100,7 @@ def backfill_seed_defaults(db: Session) -> None:
     if not FILES_DIR.exists():
         return
     games = db.execute(select(Game)).scalars().all()
-    gacha_map = load_game_gacha_map()
-    memo_map = load_game_memo_map()
-    refresh_map = load_game_refresh_map()
+    gacha_map, memo_map, refresh_map = load_game_meta_maps()
     if gacha_map or memo_map:
         for game in games:
             if (game.gacha or 0) == 0 and gacha_map:
@@ -1659,36 +2130,34 @@ def backfill_seed_defaults(db: Session) -> None:
             game.refresh_day = ref_day
             game.refresh_time = ref_time
     currency_map = load_currency_meta_map()
-    if currency_map:
-        for game in games:
-            latest = get_latest_currencies(db, game)
-            for cur in latest:
-                key = (game.title, cur.title)
-                if key not in currency_map:
-                    continue
-                ctype, value = currency_map[key]
-                if not cur.type:
-                    cur.type = ctype
-                if cur.value is None:
-                    cur.value = value
+    if currency_map and games:
+        titles = {game.id: game.title for game in games}
+        for cur in db.execute(latest_currency_query(Currency.game_id.in_(list(titles)))).scalars():
+            key = (titles[cur.game_id], cur.title)
+            if key not in currency_map:
+                continue
+            ctype, value = currency_map[key]
+            if not cur.type:
+                cur.type = ctype
+            if cur.value is None:
+                cur.value = value
 
 
 def compute_gacha_pull(game: Game, db: Session, latest_currencies: Optional[List[Currency]] = None) -> Tuple[int, str]:
     if not game.gacha or game.gacha <= 0:
         return 0, "이 게임은 뽑기가 없는 게임이네요. 재밌게 즐기세요!"
-    currencies = latest_currencies or get_latest_currencies(db, game)
+    currencies = latest_currencies if latest_currencies is not None else get_latest_currencies(db, game)
     total_units = 0
     for cur in currencies:
-        ctype = normalize_currency_type(cur.type)
-        if ctype not in {"MAIN", "GACHA"}:
+        if normalize_currency_type(cur.type) not in PULL_CURRENCY_TYPES:
             continue
-        value = cur.value if cur.value is not None else 1
-        try:
-            val = float(value)
-        except (TypeError, ValueError):
-            val = 1.0
-        units = int(val * cur.counts)
-        total_units += units
+        value = cur.value
+        if type(value) is not float:
+            try:
+                value = float(value) if value is not None else 1.0
+            except (TypeError, ValueError):
+                value = 1.0
+        total_units += int(value * cur.counts)
     pulls = total_units // game.gacha
     message = f"현재 보유 중인 재화로 {pulls}번 뽑기를 할 수 있어요!"
     return pulls, message
@@ -1697,30 +2166,29 @@ def compute_gacha_pull(game: Game, db: Session, latest_currencies: Optional[List
 @app.get("/games/{game_id}/characters", response_model=List[CharacterOut])
 def list_characters(game_id: int, db: Session = Depends(get_db)):
     game = get_game_or_404(game_id, db)
-    result = db.execute(
-        select(Character)
+    rows = db.execute(
+        select(*(getattr(Character, name) for name in CharacterOut.model_fields))
         .where(Character.game_id == game.id)
         .order_by(Character.is_have.desc(), Character.title.asc())
-    )
-    return result.scalars().all()
+    ).all()
+    return list_response(CHARACTER_LIST, rows)
 
 
 @app.get("/games/{game_id}/currencies", response_model=List[CurrencyOut])
 def list_currencies(game_id: int, db: Session = Depends(get_db)):
     game = get_game_or_404(game_id, db)
-    return get_latest_currencies(db, game)
+    return list_response(CURRENCY_LIST, get_latest_currencies(db, game))
 
 
 @app.get("/games/{game_id}/tasks", response_model=TaskOut)
-def get_tasks(game_id: int, db: Session = Depends(get_db)) -> TaskOut:
+def get_tasks(game_id: int, db: Session = Depends(get_db)) -> Response:
     game = get_game_or_404(game_id, db)
     task = get_task_or_404(game.id, db)
-    changed = _ensure_task_resets(task, game, db)
+    changed, decoded = _ensure_task_resets(task, game, db)
     changed = _apply_spending_rewards(game, db) or changed
     if changed:
         db.commit()
-        db.refresh(task)
-    return task_to_out(task, db)
+    return model_response(task_to_out(task, db, decoded))
 
 
 @app.post(
@@ -1730,16 +2198,16 @@ def get_tasks(game_id: int, db: Session = Depends(get_db)) -> TaskOut:
 )
 def update_tasks(
     game_id: int, payload: TaskUpdate, db: Session = Depends(get_db)
-) -> TaskOut:
+) -> Response:
     game = get_game_or_404(game_id, db)
     task = get_task_or_404(game.id, db)
-    _ensure_task_resets(task, game, db)
-    lists = list(_task_lists(task))
-    states = list(_task_states(task, tuple(lists)))
-    reward_states = list(_reward_states(task, tuple(lists)))
+    _, decoded = _ensure_task_resets(task, game, db)
+    lists = list(decoded.lists)
+    states = decoded.states
+    reward_states = decoded.reward_states
     rewards: List[List[List[RewardIn]]] = [
-        [[RewardIn(title=r.title, count=r.count) for r in row] for row in decoded]
-        for decoded in _task_rewards(task, tuple(lists))
+        [[RewardIn(title=r.title, count=r.count) for r in row] for row in kind]
+        for kind in decoded.rewards
     ]
 
     def apply_updates(idx: int, new_values: Optional[List[str]]):
@@ -1791,8 +2259,7 @@ def update_tasks(
     task.weekly_reward_state = _encode_state(reward_states[1])
     task.monthly_reward_state = _encode_state(reward_states[2])
     db.commit()
-    db.refresh(task)
-    return task_to_out(task, db)
+    return model_response(task_to_out(task, db))
 
 
 def _normalize_state(new_state: Optional[List[bool]], length: int, current: List[bool]) -> List[bool]:
@@ -1809,16 +2276,13 @@ def _normalize_state(new_state: Optional[List[bool]], length: int, current: List
     response_model=TaskOut,
     dependencies=[Depends(require_admin_token)],
 )
-def update_task_state(task_id: int, payload: TaskStateUpdate, db: Session = Depends(get_db)) -> TaskOut:
+def update_task_state(task_id: int, payload: TaskStateUpdate, db: Session = Depends(get_db)) -> Response:
     task = db.get(Task, task_id)
     if not task:
         raise HTTPException(status_code=404, detail="Task not found")
     game = task.game or get_game_or_404(task.game_id, db)
-    _ensure_task_resets(task, game, db)
-    lists = _task_lists(task)
-    rewards = _task_rewards(task, lists)
-    prev_states = list(_task_states(task, lists))
-    reward_states = list(_reward_states(task, lists))
+    _, decoded = _ensure_task_resets(task, game, db)
+    lists, prev_states, rewards, reward_states = decoded
     states = list(prev_states)
     states[0] = _normalize_state(payload.daily_state, len(lists[0]), states[0])
     states[1] = _normalize_state(payload.weekly_state, len(lists[1]), states[1])
@@ -1834,8 +2298,7 @@ def update_task_state(task_id: int, payload: TaskStateUpdate, db: Session = Depe
     task.weekly_reward_state = _encode_state(reward_states[1])
     task.monthly_reward_state = _encode_state(reward_states[2])
     db.commit()
-    db.refresh(task)
-    return task_to_out(task, db)
+    return model_response(task_to_out(task, db, _TaskDecoded(lists, states, rewards, reward_states)))
 
 
 @app.post(
@@ -1851,7 +2314,7 @@ def adjust_currency(
         raise HTTPException(status_code=404, detail="Currency not found")
     new_entry = Currency(
         title=currency.title,
-        game=currency.game,
+        game_id=currency.game_id,
         counts=payload.counts,
         timestamp=dt.datetime.now(dt.timezone.utc),
         type=currency.type,
@@ -1859,7 +2322,7 @@ def adjust_currency(
     )
     db.add(new_entry)
     db.commit()
-    db.refresh(new_entry)
+    TIMESERIES_CACHE.invalidate(currency.game_id)
     return new_entry
 
 
@@ -1870,17 +2333,40 @@ def list_game_events(game_id: int, db: Session = Depends(get_db)):
         select(GameEvent)
         .where(GameEvent.game_id == game.id)
         .order_by(GameEvent.start_date.asc(), GameEvent.id.asc())
+        .options(raiseload("*"))
     )
-    return result.scalars().all()
+    return list_response(GAME_EVENT_LIST, result.scalars().all())
 
 
 @app.get("/games/{game_id}/spendings", response_model=List[SpendingOut])
 def list_spendings(game_id: int, db: Session = Depends(get_db)):
     game = get_game_or_404(game_id, db)
-    result = db.execute(select(Spending).where(Spending.game_id == game.id))
+    result = db.execute(
+        select(Spending)
+        .where(Spending.game_id == game.id)
+        .order_by(
+            func.julianday(Spending.paying_date) + Spending.expiration_days,
+            Spending.id.asc(),
+        )
+        .options(
+            load_only(
+                Spending.id,
+                Spending.game_id,
+                Spending.title,
+                Spending.paying,
+                Spending.paying_date,
+                Spending.type,
+                Spending.expiration_days,
+                Spending.reward_mode,
+                Spending.reward_items,
+                Spending.pass_current_level,
+                Spending.pass_max_level,
+            ),
+            raiseload("*"),
+        )
+    )
     spendings = result.scalars().all()
-    spendings.sort(key=lambda s: s.next_paying_date)
-    return [_spending_to_out(s) for s in spendings]
+    return list_response(SPENDING_LIST, [_spending_to_out(s) for s in spendings])
 
 
 @app.post(
@@ -1893,7 +2379,6 @@ def end_game(game_id: int, payload: GameEndPayload, db: Session = Depends(get_db
     game.end_date = payload.end_date or dt.date.today()
     game.stop_play = True
     db.commit()
-    db.refresh(game)
     return game
 
 
@@ -1927,8 +2412,7 @@ def renew_spending(
     spending.reward_once_granted = False
     spending.last_reward_at = None
     db.commit()
-    db.refresh(spending)
-    return _spending_to_out(spending)
+    return model_response(_spending_to_out(spending))
 
 
 @app.post(
@@ -1938,13 +2422,13 @@ def renew_spending(
 )
 def configure_spending(
     spending_id: int, payload: SpendingConfigUpdate, db: Session = Depends(get_db)
-) -> SpendingOut:
+) -> Response:
     spending = db.get(Spending, spending_id)
     if not spending:
         raise HTTPException(status_code=404, detail="Spending not found")
     if payload.reward_mode:
         mode = payload.reward_mode.upper()
-        if mode not in {"DAILY", "ONCE", "DISABLED"}:
+        if mode not in REWARD_MODES:
             raise HTTPException(status_code=400, detail="reward_mode must be DAILY, ONCE, or DISABLED")
         spending.reward_mode = mode
     if payload.rewards is not None:
@@ -1967,8 +2451,7 @@ def configure_spending(
         spending.reward_once_granted = False
         spending.last_reward_at = None
     db.commit()
-    db.refresh(spending)
-    return _spending_to_out(spending)
+    return model_response(_spending_to_out(spending))
 
 
 @app.post(
@@ -1991,7 +2474,6 @@ def create_game_event(
     )
     db.add(event)
     db.commit()
-    db.refresh(event)
     return event
 
 
@@ -2003,17 +2485,22 @@ def create_game_event(
 def update_game_event(
     game_id: int, event_id: int, payload: EventCreate, db: Session = Depends(get_db)
 ):
-    game = get_game_or_404(game_id, db)
-    event = db.get(GameEvent, event_id)
-    if not event or event.game_id != game.id:
+    event = db.execute(
+        update(GameEvent)
+        .where(GameEvent.id == event_id, GameEvent.game_id == game_id)
+        .values(
+            title=payload.title,
+            type=payload.type,
+            start_date=payload.start_date,
+            end_date=payload.end_date,
+            priority=payload.priority,
+        )
+        .returning(GameEvent)
+    ).scalar_one_or_none()
+    if event is None:
+        get_game_or_404(game_id, db)
         raise HTTPException(status_code=404, detail="Event not found")
-    event.title = payload.title
-    event.type = payload.type
-    event.start_date = payload.start_date
-    event.end_date = payload.end_date
-    event.priority = payload.priority
     db.commit()
-    db.refresh(event)
     return event
 
 
@@ -2026,9 +2513,10 @@ def update_game_memo(
     game_id: int, payload: GameMemoUpdate, db: Session = Depends(get_db)
 ):
     game = get_game_or_404(game_id, db)
-    game.memo = payload.memo or None
-    db.commit()
-    db.refresh(game)
+    memo = payload.memo or None
+    if game.memo != memo:
+        game.memo = memo
+        db.commit()
     pull_count, pull_msg = compute_gacha_pull(game, db)
     game.gacha_pull_count = pull_count
     game.gacha_pull_message = pull_msg
@@ -2043,67 +2531,36 @@ def update_game_memo(
 def update_character(
     character_id: int, payload: CharacterUpdate, db: Session = Depends(get_db)
 ):
-    character = db.get(Character, character_id)
+    values = payload.model_dump(exclude_none=True)
+    if values:
+        character = db.execute(
+            update(Character)
+            .where(Character.id == character_id)
+            .values(**values)
+            .returning(Character)
+        ).scalar_one_or_none()
+    else:
+        character = db.get(Character, character_id)
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
-    if payload.level is not None:
-        character.level = payload.level
-    if payload.grade is not None:
-        character.grade = payload.grade
-    if payload.overpower is not None:
-        character.overpower = payload.overpower
-    if payload.is_have is not None:
-        character.is_have = payload.is_have
     db.commit()
-    db.refresh(character)
     return character
 
 
-def _latest_count_on_or_before(entries: List[Currency], target: dt.date, title: Optional[str] = None) -> int:
-    day_end = dt.datetime.combine(target, dt.time.max, dt.timezone.utc)
-    filtered = [
-        e
-        for e in entries
-        if (title is None or e.title == title) and _ts(e.timestamp) <= day_end
-    ]
-    if not filtered:
-        return 0
-    filtered.sort(key=lambda e: (_ts(e.timestamp), e.id), reverse=True)
-    if title:
-        return filtered[0].counts
-    # sum latest per title
-    latest_by_title: dict[str, Currency] = {}
-    for e in filtered:
-        if e.title not in latest_by_title:
-            latest_by_title[e.title] = e
-    return sum(v.counts for v in latest_by_title.values())
-
-
-def _max_or_latest_in_range(
-    entries: List[Currency],
-    start_date: dt.date,
-    end_date: dt.date,
-    title: Optional[str] = None,
-) -> int:
-    start_dt = dt.datetime.combine(start_date, dt.time.min, dt.timezone.utc)
-    end_dt = dt.datetime.combine(end_date, dt.time.max, dt.timezone.utc)
-    if title:
-        in_range = [
-            e
-            for e in entries
-            if e.title == title and start_dt <= _ts(e.timestamp) <= end_dt
-        ]
-        if in_range:
-            in_range.sort(key=lambda e: (_ts(e.timestamp), e.id), reverse=True)
-            return in_range[0].counts
-        return _latest_count_on_or_before(entries, end_date, title=title)
+CurrencyBucketRow = Tuple[str, int, int]
+
 
-    # ALL: sum per title using their own max-or-latest in range
-    titles = {e.title for e in entries}
+def _currency_bucket_totals(rows: List[CurrencyBucketRow], n_buckets: int) -> List[int]:
+    latest_by_title: Dict[str, int] = {}
+    totals: List[int] = []
     total = 0
-    for t in titles:
-        total += _max_or_latest_in_range(entries, start_date, end_date, title=t)
-    return total
+    for entry_title, bucket, count in rows:
+        if bucket > len(totals):
+            totals.extend([total] * (bucket - len(totals)))
+        total += count - latest_by_title.get(entry_title, 0)
+        latest_by_title[entry_title] = count
+    totals.extend([total] * (n_buckets - len(totals)))
+    return totals
 
 
 def _game_refresh_info(game: Game) -> Tuple[Optional[int], dt.time]:
@@ -2154,10 +2611,31 @@ def _most_recent_monthly(now: dt.datetime, refresh_time: dt.time) -> dt.datetime
     return anchor
 
 
+ResetAnchors = Tuple[dt.datetime, Optional[dt.datetime], dt.datetime]
+
+
+@functools.lru_cache(maxsize=64)
+def _reset_anchors_at(
+    _second: int, refresh_day: Optional[int], refresh_time: dt.time
+) -> ResetAnchors:
+    now = dt.datetime.fromtimestamp(_second, LOCAL_TZ)
+    weekly = _most_recent_weekly(now, refresh_time, refresh_day) if refresh_day else None
+    return (
+        _most_recent_daily(now, refresh_time),
+        weekly,
+        _most_recent_monthly(now, refresh_time),
+    )
+
+
+def _reset_anchors(game: Game) -> ResetAnchors:
+    refresh_day, refresh_time = _game_refresh_info(game)
+    return _reset_anchors_at(int(time.time()), refresh_day, refresh_time)
+
+
 def _needs_reset(last: Optional[dt.datetime], target: dt.datetime) -> bool:
     if last is None:
         return True
-    return _ts(last) < _ts(target)
+    return last < target
 
 
 def _task_lists(task: Task) -> Tuple[List[str], List[str], List[str]]:
@@ -2199,6 +2677,23 @@ def _reward_states(
     )
 
 
+class _TaskDecoded(NamedTuple):
+    lists: Tuple[List[str], List[str], List[str]]
+    states: List[List[bool]]
+    rewards: Tuple[List[List[RewardOut]], List[List[RewardOut]], List[List[RewardOut]]]
+    reward_states: List[List[bool]]
+
+
+def _decode_task(task: Task) -> _TaskDecoded:
+    lists = _task_lists(task)
+    return _TaskDecoded(
+        lists,
+        list(_task_states(task, lists)),
+        _task_rewards(task, lists),
+        list(_reward_states(task, lists)),
+    )
+
+
 def _apply_reward_on_completion(
     game: Game,
     rewards: Tuple[List[List[RewardOut]], List[List[RewardOut]], List[List[RewardOut]]],
@@ -2207,6 +2702,8 @@ def _apply_reward_on_completion(
     reward_states: List[List[bool]],
     db: Session,
 ) -> None:
+    latest_map: Optional[Dict[str, Currency]] = None
+    granted: List[Currency] = []
     for idx in range(3):
         reward_rows = rewards[idx] if idx < len(rewards) else []
         prev = prev_states[idx] if idx < len(prev_states) else []
@@ -2216,17 +2713,55 @@ def _apply_reward_on_completion(
             was = prev[i] if i < len(prev) else False
             already = rstates[i] if i < len(rstates) else False
             if state_now and not was and not already:
-                for rew in reward_rows[i] if i < len(reward_rows) else []:
-                    _grant_currency(game, rew, db)
+                row = reward_rows[i] if i < len(reward_rows) else ()
+                if row and latest_map is None:
+                    latest_map = {c.title: c for c in get_latest_currencies(db, game)}
+                for rew in row:
+                    _grant_currency(game, rew, latest_map, granted)
                 if i < len(rstates):
                     rstates[i] = True
+    _insert_currencies(db, game, granted)
+
+
+def _spending_reward_candidates(today: dt.date) -> tuple:
+    # SQL 에서 먼저 넉넉하게 거르고, 최종 판정은 아래 루프에서
+    mode = func.upper(func.coalesce(Spending.reward_mode, ""))
+    return (
+        func.julianday(Spending.paying_date) + Spending.expiration_days
+        >= func.julianday(today.isoformat()),
+        Spending.reward_items.is_not(None),
+        Spending.reward_items != "[]",
+        mode != "DISABLED",
+        or_(Spending.reward_once_granted.is_(False), mode != "ONCE"),
+    )
 
 
-def _apply_spending_rewards(game: Game, db: Session) -> bool:
-    now = dt.datetime.now(LOCAL_TZ)
-    _, refresh_time = _game_refresh_info(game)
-    anchor_daily = _most_recent_daily(now, refresh_time)
-    spendings = db.execute(select(Spending).where(Spending.game_id == game.id)).scalars().all()
+def _apply_spending_rewards(
+    game: Game,
+    db: Session,
+    spendings: Optional[Sequence[Spending]] = None,
+    latest_currencies: Optional[List[Currency]] = None,
+    flush: bool = True,
+) -> bool:
+    anchor_daily = _reset_anchors(game)[0]
+    if spendings is None:
+        spendings = db.execute(
+            select(Spending).where(
+                Spending.game_id == game.id, *_spending_reward_candidates(today_local())
+            )
+        ).scalars().all()
+    latest_map: Optional[Dict[str, Currency]] = None
+    if latest_currencies is not None:
+        latest_map = {c.title: c for c in latest_currencies}
+    granted: List[Currency] = []
+
+    def grant(rewards: List[RewardOut]) -> None:
+        nonlocal latest_map
+        if latest_map is None:
+            latest_map = {c.title: c for c in get_latest_currencies(db, game)}
+        for rew in rewards:
+            _grant_currency(game, rew, latest_map, granted)
+
     changed = False
     today = today_local()
     for sp in spendings:
@@ -2241,8 +2776,7 @@ def _apply_spending_rewards(game: Game, db: Session) -> bool:
         if mode == "DAILY":
             last = sp.last_reward_at
             if _needs_reset(last, anchor_daily):
-                for rew in rewards:
-                    _grant_currency(game, rew, db)
+                grant(rewards)
                 sp.last_reward_at = anchor_daily
                 changed = True
         else:
@@ -2251,11 +2785,11 @@ def _apply_spending_rewards(game: Game, db: Session) -> bool:
                     threshold = int(sp.pass_max_level * 0.75)
                     if sp.pass_current_level < threshold:
                         continue
-                for rew in rewards:
-                    _grant_currency(game, rew, db)
+                grant(rewards)
                 sp.reward_once_granted = True
                 changed = True
-    if changed:
+    _insert_currencies(db, game, granted)
+    if changed and flush:
         db.flush()
     return changed
 
@@ -2281,43 +2815,66 @@ def _spending_to_out(spending: "Spending") -> "SpendingOut":
     )
 
 
-def _grant_currency(game: Game, reward: RewardOut, db: Session) -> None:
+def _grant_currency(
+    game: Game, reward: RewardOut, latest_map: Dict[str, Currency], granted: List[Currency]
+) -> None:
     if not reward.title or reward.count is None:
         return
     count = int(reward.count)
     if count == 0:
         return
-    latest = get_latest_currencies(db, game)
-    latest_map = {c.title: c for c in latest}
     cur = latest_map.get(reward.title)
     new_counts = (cur.counts if cur else 0) + count
     if new_counts < 0:
         new_counts = 0
     new_entry = Currency(
         title=reward.title,
-        game=game,
+        game_id=game.id,  # game 관계를 걸면 세션에 cascade 되어 ORM INSERT 가 따로 나감
         counts=new_counts,
         timestamp=dt.datetime.now(dt.timezone.utc),
         type=cur.type if cur else None,
         value=cur.value if cur else None,
     )
-    db.add(new_entry)
+    latest_map[reward.title] = new_entry
+    granted.append(new_entry)
+
+
+def _insert_currencies(db: Session, game: Game, rows: List[Currency]) -> None:
+    if not rows:
+        return
+    db.execute(
+        insert(Currency),
+        [
+            {
+                "title": c.title,
+                "game_id": c.game_id,
+                "counts": c.counts,
+                "timestamp": c.timestamp,
+                "type": c.type,
+                "value": c.value,
+            }
+            for c in rows
+        ],
+    )
+    mark_timeseries_stale(db, game.id)
 
 
-def _ensure_task_resets(task: Task, game: Game, db: Session) -> bool:
+def _ensure_task_resets(
+    task: Task, game: Game, db: Session, flush: bool = True
+) -> Tuple[bool, _TaskDecoded]:
     changed = False
-    now = dt.datetime.now(LOCAL_TZ)
-    refresh_day, refresh_time = _game_refresh_info(game)
-    lists = _task_lists(task)
-    daily_list, weekly_list, monthly_list = lists
-    states = list(_task_states(task, lists))
-    reward_states = list(_reward_states(task, lists))
+    recent_daily, recent_weekly, recent_monthly = _reset_anchors(game)
+    decoded = _decode_task(task)
+    daily_list, weekly_list, monthly_list = decoded.lists
+    states = decoded.states
+    reward_states = decoded.reward_states
+
+    history_rows: List[TaskHistory] = []
 
-    recent_daily = _most_recent_daily(now, refresh_time)
     if _needs_reset(task.last_daily_reset, recent_daily):
         if daily_list:
-            db.add(
-                    TaskHistory(
+            history_rows.append(
+                TaskHistory(
                     task=task,
                     daily_done=int(all(states[0])) if states[0] else 0,
                     timestamp=recent_daily,
@@ -2325,33 +2882,29 @@ def _ensure_task_resets(task: Task, game: Game, db: Session) -> bool:
             )
         states[0] = [False] * len(daily_list)
         reward_states[0] = [False] * len(daily_list)
-        task.daily_state = _encode_state(states[0])
-        task.daily_reward_state = _encode_state(reward_states[0])
+        task.daily_state = task.daily_reward_state = _cleared_state(len(daily_list))
         task.last_daily_reset = recent_daily
         changed = True
 
-    if refresh_day:
-        recent_weekly = _most_recent_weekly(now, refresh_time, refresh_day)
+    if recent_weekly is not None:
         if _needs_reset(task.last_weekly_reset, recent_weekly):
             if weekly_list:
-                db.add(
+                history_rows.append(
                     TaskHistory(
-                    task=task,
-                    weekly_done=int(all(states[1])) if states[1] else 0,
-                    timestamp=recent_weekly,
+                        task=task,
+                        weekly_done=int(all(states[1])) if states[1] else 0,
+                        timestamp=recent_weekly,
+                    )
                 )
-            )
-        states[1] = [False] * len(weekly_list)
-        reward_states[1] = [False] * len(weekly_list)
-        task.weekly_state = _encode_state(states[1])
-        task.weekly_reward_state = _encode_state(reward_states[1])
-        task.last_weekly_reset = recent_weekly
-        changed = True
+            states[1] = [False] * len(weekly_list)
+            reward_states[1] = [False] * len(weekly_list)
+            task.weekly_state = task.weekly_reward_state = _cleared_state(len(weekly_list))
+            task.last_weekly_reset = recent_weekly
+            changed = True
 
-    recent_monthly = _most_recent_monthly(now, refresh_time)
     if _needs_reset(task.last_monthly_reset, recent_monthly):
         if monthly_list:
-            db.add(
+            history_rows.append(
                 TaskHistory(
                     task=task,
                     monthly_done=int(all(states[2])) if states[2] else 0,
@@ -2360,32 +2913,38 @@ def _ensure_task_resets(task: Task, game: Game, db: Session) -> bool:
             )
         states[2] = [False] * len(monthly_list)
         reward_states[2] = [False] * len(monthly_list)
-        task.monthly_state = _encode_state(states[2])
-        task.monthly_reward_state = _encode_state(reward_states[2])
+        task.monthly_state = task.monthly_reward_state = _cleared_state(len(monthly_list))
         task.last_monthly_reset = recent_monthly
         changed = True
-    db.flush()
-    return changed
-
-def _latest_history(task: Task, db: Session, field: str) -> Optional[int]:
-    col = getattr(TaskHistory, field)
-    row = (
-        db.execute(
-            select(TaskHistory)
+    if changed:
+        db.add_all(history_rows)
+        if flush:  # autoflush 가 꺼져 있어 _task_messages 가 새 TaskHistory 를 보려면 필요
+            db.flush()
+    return changed, decoded
+
+def _latest_history(task: Task, db: Session) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    def newest(col):
+        return (
+            select(col)
             .where(TaskHistory.task_id == task.id, col.is_not(None))
             .order_by(TaskHistory.timestamp.desc())
             .limit(1)
+            .scalar_subquery()
         )
-    ).scalar_one_or_none()
-    if not row:
-        return None
-    return getattr(row, field)
+
+    return tuple(
+        db.execute(
+            select(
+                newest(TaskHistory.daily_done),
+                newest(TaskHistory.weekly_done),
+                newest(TaskHistory.monthly_done),
+            )
+        ).one()
+    )
 
 
 def _task_messages(task: Task, db: Session) -> Tuple[Optional[str], Optional[str], Optional[str]]:
-    daily_prev = _latest_history(task, db, "daily_done")
-    weekly_prev = _latest_history(task, db, "weekly_done")
-    monthly_prev = _latest_history(task, db, "monthly_done")
+    daily_prev, weekly_prev, monthly_prev = _latest_history(task, db)
     daily_msg = None
     weekly_msg = None
     monthly_msg = None
@@ -2410,10 +2969,8 @@ def _task_messages(task: Task, db: Session) -> Tuple[Optional[str], Optional[str
     return daily_msg, weekly_msg, monthly_msg
 
 
-def task_to_out(task: Task, db: Session) -> TaskOut:
-    lists = _task_lists(task)
-    states = _task_states(task, lists)
-    rewards = _task_rewards(task, lists)
+def task_to_out(task: Task, db: Session, decoded: Optional[_TaskDecoded] = None) -> TaskOut:
+    lists, states, rewards, _ = decoded or _decode_task(task)
     daily_msg, weekly_msg, monthly_msg = _task_messages(task, db)
     return TaskOut(
         id=task.id,
@@ -2433,6 +2990,71 @@ def task_to_out(task: Task, db: Session) -> TaskOut:
     )
 
 
+def _load_currency_buckets(
+    db: Session,
+    game_id: int,
+    window_start: dt.date,
+    window_end: dt.date,
+    step_days: int,
+    title: Optional[str] = None,
+) -> List[CurrencyBucketRow]:
+    start_text = window_start.isoformat()
+    end_dt = dt.datetime.combine(window_end, dt.time.max, dt.timezone.utc)
+    criteria = [Currency.game_id == game_id]
+    if title:
+        criteria.append(Currency.title == title)
+
+    titles = select(Currency.title).where(*criteria).distinct().subquery()
+    prior = aliased(Currency)
+    carried = (
+        select(prior.counts)
+        .where(
+            prior.game_id == game_id,
+            prior.title == titles.c.title,
+            prior.timestamp.is_(None) | (type_coerce(prior.timestamp, String) < start_text),
+        )
+        .order_by(prior.timestamp.desc(), prior.id.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    rows: List[CurrencyBucketRow] = [
+        (entry_title, -1, count)
+        for entry_title, count in db.execute(select(titles.c.title, carried))
+        if count is not None
+    ]
+
+    day_offset = func.julianday(func.substr(Currency.timestamp, 1, 10)) - func.julianday(start_text)
+    bucket = cast(day_offset, Integer) // step_days
+    ranked = (
+        select(
+            Currency.title,
+            bucket.label("bucket"),
+            Currency.counts,
+            func.row_number()
+            .over(
+                partition_by=(Currency.title, bucket),
+                order_by=(Currency.timestamp.desc(), Currency.id.desc()),
+            )
+            .label("rn"),
+        )
+        .where(
+            *criteria,
+            type_coerce(Currency.timestamp, String) >= start_text,
+            Currency.timestamp <= end_dt,
+        )
+        .subquery()
+    )
+    rows.extend(
+        tuple(row)
+        for row in db.execute(
+            select(ranked.c.title, ranked.c.bucket, ranked.c.counts)
+            .where(ranked.c.rn == 1)
+            .order_by(ranked.c.bucket)
+        )
+    )
+    return rows
+
+
 @app.get("/games/{game_id}/currencies/timeseries", response_model=CurrencyTimeseries)
 def currency_timeseries(
     game_id: int,
@@ -2442,37 +3064,50 @@ def currency_timeseries(
     weeks: int = 8,
     start_date: Optional[dt.date] = None,
     db: Session = Depends(get_db),
-):
+) -> Response:
     game = get_game_or_404(game_id, db)
-    entries = (
-        db.execute(
-            select(Currency)
-            .where(Currency.game_id == game.id)
-            .order_by(Currency.timestamp.asc(), Currency.id.asc())
-        )
-        .scalars()
-        .all()
-    )
     today = dt.date.today()
+    body = TIMESERIES_CACHE.get_or_build(
+        game.id,
+        (title, days, weekly, weeks, start_date, today),
+        lambda: _build_currency_timeseries(
+            db, game.id, title, days, weekly, weeks, start_date, today
+        ).model_dump_json(),
+    )
+    return Response(content=body, media_type="application/json")
 
+
+def _bucket_dates(first: dt.date, count: int, step_days: int) -> List[dt.date]:
+    base = first.toordinal()
+    return [dt.date.fromordinal(base + k) for k in range(0, count * step_days, step_days)]
+
+
+def _build_currency_timeseries(
+    db: Session,
+    game_id: int,
+    title: Optional[str],
+    days: int,
+    weekly: bool,
+    weeks: int,
+    start_date: Optional[dt.date],
+    today: dt.date,
+) -> CurrencyTimeseries:
     if weekly:
         weeks = max(1, min(weeks, 15))
         if start_date:
-            buckets: List[CurrencyTimeseriesBucket] = []
             anchor_idx = max(0, weeks - 3)  # place anchor at third from right
+            first_start = start_date - dt.timedelta(days=7 * anchor_idx)
+            week_ends = _bucket_dates(first_start + dt.timedelta(days=6), weeks, 7)
+            totals = _currency_bucket_totals(
+                _load_currency_buckets(db, game_id, first_start, week_ends[-1], 7, title=title), weeks
+            )
+            open_until = today + dt.timedelta(days=6)
+            buckets: List[CurrencyTimeseriesBucket] = []
             last_count: Optional[int] = None
-            for i in range(weeks):
-                offset = i - anchor_idx
-                week_start = start_date + dt.timedelta(days=7 * offset)
-                week_end = week_start + dt.timedelta(days=6)
-                count = None
-                if week_start <= today:
-                    count = _max_or_latest_in_range(entries, week_start, week_end, title=title)
-                if count is None:
-                    count = last_count
-                else:
-                    last_count = count
-                buckets.append(CurrencyTimeseriesBucket(date=week_end, count=count))
+            for week_end, total in zip(week_ends, totals):
+                if week_end <= open_until:
+                    last_count = total
+                buckets.append(CurrencyTimeseriesBucket(date=week_end, count=last_count))
             return CurrencyTimeseries(
                 title=title or "ALL",
                 buckets=buckets,
@@ -2481,12 +3116,15 @@ def currency_timeseries(
             )
         delta = (today.weekday() + 1) % 7  # days since last Sunday
         current_week_start = today - dt.timedelta(days=delta)
-        buckets: List[CurrencyTimeseriesBucket] = []
-        for i in range(weeks):
-            week_start = current_week_start - dt.timedelta(days=7 * i)
-            week_end = week_start + dt.timedelta(days=6)
-            count = _max_or_latest_in_range(entries, week_start, week_end, title=title)
-            buckets.append(CurrencyTimeseriesBucket(date=week_end, count=count))
+        first_start = current_week_start - dt.timedelta(days=7 * (weeks - 1))
+        week_ends = _bucket_dates(first_start + dt.timedelta(days=6), weeks, 7)
+        totals = _currency_bucket_totals(
+            _load_currency_buckets(db, game_id, first_start, week_ends[-1], 7, title=title), weeks
+        )
+        buckets = [
+            CurrencyTimeseriesBucket(date=week_end, count=total)
+            for week_end, total in zip(reversed(week_ends), reversed(totals))
+        ]
         return CurrencyTimeseries(
             title=title or "ALL",
             buckets=buckets,
@@ -2496,19 +3134,20 @@ def currency_timeseries(
 
     days = max(1, min(days, 30))
     start = today - dt.timedelta(days=days - 1)
-    buckets: List[CurrencyTimeseriesBucket] = []
-    for i in range(days):
-        day = start + dt.timedelta(days=i)
-        count = _latest_count_on_or_before(entries, day, title=title)
-        buckets.append(CurrencyTimeseriesBucket(date=day, count=count))
+    totals = _currency_bucket_totals(
+        _load_currency_buckets(db, game_id, start, today, 1, title=title), days
+    )
+    buckets = [
+        CurrencyTimeseriesBucket(date=day, count=total)
+        for day, total in zip(_bucket_dates(start, days, 1), totals)
+    ]
     return CurrencyTimeseries(
         title=title or "ALL", buckets=buckets, from_date=start, to_date=today
     )
 
 
 @app.get("/", include_in_schema=False)
-def serve_index():
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+def serve_index(request: Request):
+    if INDEX_PAGE is not None:
+        return static_asset_response(request, INDEX_PAGE, "text/html")
     return {"message": "Frontend not built yet"}
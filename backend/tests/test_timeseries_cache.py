@@ -0,0 +1,134 @@
+import datetime as dt
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+_TMP = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP}/test.db"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app  # noqa: E402
+
+
+def _timeseries(game_id: int) -> dict:
+    db = app.SessionLocal()
+    try:
+        return json.loads(app.currency_timeseries(game_id, days=3, db=db).body)
+    finally:
+        db.close()
+
+
+class GameTTLCacheTest(unittest.TestCase):
+    def test_concurrent_callers_share_one_build(self):
+        cache = app.GameTTLCache(60)
+        release = threading.Event()
+        calls = []
+
+        def build():
+            calls.append(1)
+            release.wait(5)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get_or_build(1, ("k",), build)))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        release.set()
+        for t in threads:
+            t.join(5)
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, ["value"] * 4)
+
+    def test_build_straddling_invalidation_is_not_stored(self):
+        cache = app.GameTTLCache(60)
+        started, release = threading.Event(), threading.Event()
+
+        def build():
+            started.set()
+            release.wait(5)
+            return "old"
+
+        reader = threading.Thread(target=lambda: cache.get_or_build(1, ("k",), build))
+        reader.start()
+        started.wait(5)
+        cache.invalidate(1)
+        release.set()
+        reader.join(5)
+        self.assertIsNone(cache.get(1, ("k",)))
+
+
+class TimeseriesInvalidationTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        app.init_db()
+        db = app.SessionLocal()
+        game = app.Game(title="cache-test", start_date=dt.date(2024, 1, 1))
+        db.add(game)
+        db.flush()
+        db.add(
+            app.Currency(
+                title="gem",
+                game_id=game.id,
+                counts=100,
+                timestamp=dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=1),
+            )
+        )
+        db.commit()
+        cls.game_id = game.id
+        db.close()
+
+    def setUp(self):
+        app.TIMESERIES_CACHE.invalidate()
+
+    def test_read_between_insert_and_commit_does_not_survive_commit(self):
+        writer = app.SessionLocal()
+        try:
+            game = writer.get(app.Game, self.game_id)
+            granted = [
+                app.Currency(
+                    title="gem",
+                    game_id=game.id,
+                    counts=150,
+                    timestamp=dt.datetime.now(dt.timezone.utc),
+                )
+            ]
+            app._insert_currencies(writer, game, granted)
+
+            # 다른 요청이 커밋 전에 조회해서 옛 값을 캐시에 넣는다
+            seen = []
+            reader = threading.Thread(target=lambda: seen.append(_timeseries(self.game_id)))
+            reader.start()
+            reader.join(10)
+            self.assertEqual(seen[0]["buckets"][-1]["count"], 100)
+
+            writer.commit()
+        finally:
+            writer.close()
+
+        self.assertEqual(_timeseries(self.game_id)["buckets"][-1]["count"], 150)
+
+    def test_rolled_back_insert_keeps_cached_entry(self):
+        before = _timeseries(self.game_id)
+        writer = app.SessionLocal()
+        try:
+            game = writer.get(app.Game, self.game_id)
+            app._insert_currencies(
+                writer,
+                game,
+                [app.Currency(title="gem", game_id=game.id, counts=999, timestamp=dt.datetime.now(dt.timezone.utc))],
+            )
+            writer.rollback()
+        finally:
+            writer.close()
+        self.assertEqual(_timeseries(self.game_id), before)
+
+
+if __name__ == "__main__":
+    unittest.main()